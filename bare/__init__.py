@@ -1,14 +1,36 @@
-# Main classes
-from .bare.restic import Restic
-from .bare.rsync import Rsync
-from .bare.gocryptfs import Gocryptfs
-from .bare.backup import Backup
-from .destination_handler import DestinationHandler
-
-# Support classes
-from .finder.devices import DeviceFinder
-from .mount.drive import MountDrive
-from .mount_manager import MountManager
-
-# Debug
-from .utils import parse_mount, execute_command
+import importlib
+
+# Public names mapped to the module defining them. They are imported on first
+# access (PEP 562) so short commands only load the modules they use.
+_ATTRS = {
+    # Main classes
+    "Restic": ".bare.restic",
+    "Rsync": ".bare.rsync",
+    "Gocryptfs": ".bare.gocryptfs",
+    "Backup": ".bare.backup",
+    "DestinationHandler": ".destination_handler",
+    "HostnameMismatchError": ".bare.base",
+    # Support classes
+    "DeviceFinder": ".finder.devices",
+    "MountDrive": ".mount.drive",
+    "MountManager": ".mount_manager",
+    # Debug
+    "parse_mount": ".utils",
+    "execute_command": ".utils",
+    "execute_command_async": ".utils",
+    "execute_command_lines": ".utils",
+}
+
+__all__ = list(_ATTRS)
+
+
+def __getattr__(name):
+    if name in _ATTRS:
+        value = getattr(importlib.import_module(_ATTRS[name], __name__), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
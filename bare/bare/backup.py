@@ -1,4 +1,5 @@
 import os
+from concurrent.futures import ThreadPoolExecutor
 from .restic import Restic
 from .rsync import Rsync
 from ..destination_handler import DestinationHandler
@@ -48,6 +49,7 @@ class Backup(Base):
             raise ValueError("Either 'destination' or 'vol_label' must be provided.")
 
         self.source = source
+        self.vol_label = vol_label
         self.destination = destination or ""
         self.restic_password = restic_password
 
@@ -59,6 +61,8 @@ class Backup(Base):
         rsync_args=None,
         mask=None,
         dry_run=False,
+        parallel=False,
+        skip_unchanged=False,
     ):
         """
         Performs the backup operation using specified methods: Restic or Rsync.
@@ -70,17 +74,41 @@ class Backup(Base):
             rsync_args (dict, optional): Additional arguments for Rsync backup.
             mask (str, optional): File mask to filter files for backup.
             dry_run (bool): If True, perform a trial run with no changes made.
+            parallel (bool): If True, run the Restic and Rsync backups concurrently.
+            skip_unchanged (bool): If True, skip the Restic backup when the source
+                files did not change since the last run.
         """
         restic_args = restic_args or {}
         rsync_args = rsync_args or {}
 
         with self.storage as base_dest_path:
+            calls = []
             if use_restic:
-                self._perform_restic_backup(base_dest_path, restic_args, mask, dry_run)
+                calls.append(
+                    lambda: self._perform_restic_backup(
+                        base_dest_path, restic_args, mask, dry_run, skip_unchanged
+                    )
+                )
             if use_rsync:
-                self._perform_rsync_backup(base_dest_path, rsync_args, mask, dry_run)
+                calls.append(
+                    lambda: self._perform_rsync_backup(
+                        base_dest_path, rsync_args, mask, dry_run
+                    )
+                )
 
-    def _perform_restic_backup(self, base_dest_path, restic_args, mask, dry_run):
+            if parallel and len(calls) > 1:
+                # The storage stays mounted until both backups have finished
+                with ThreadPoolExecutor(max_workers=len(calls)) as executor:
+                    futures = [executor.submit(call) for call in calls]
+                    for future in futures:
+                        future.result()
+            else:
+                for call in calls:
+                    call()
+
+    def _perform_restic_backup(
+        self, base_dest_path, restic_args, mask, dry_run, skip_unchanged=False
+    ):
         """Helper method to encapsulate Restic backup logic."""
         restic_runner = Restic(
             os.path.join(base_dest_path, self.destination),
@@ -88,9 +116,10 @@ class Backup(Base):
             hostname=self.hostname,
             name=self.name,
             check_hostname=False,
+            destination=os.path.join(self.vol_label or "", self.destination),
         )
         print("Performing Restic backup...")
-        restic_runner.backup(self.source, restic_args, mask, dry_run)
+        restic_runner.backup(self.source, restic_args, mask, dry_run, skip_unchanged)
 
     def _perform_rsync_backup(self, base_dest_path, rsync_args, mask, dry_run):
         """Helper method to encapsulate Rsync backup logic."""
@@ -101,4 +130,4 @@ class Backup(Base):
             check_hostname=False,
         )
         print("Performing Rsync backup...")
-        rsync_runner.backup(self.source, rsync_args, mask, dry_run)
+        rsync_runner.backup(self.source, rsync_args, mask=mask, dry_run=dry_run)
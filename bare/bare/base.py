@@ -1,7 +1,12 @@
 import os
-from ..finder.devices import DeviceFinder
-from ..mount_manager import MountManager
-from ..utils import execute_command, get_hostname, setup_environment
+from ..utils import get_hostname
+
+
+class HostnameMismatchError(Exception):
+    """
+    Raised when the configured hostname differs from the current machine's and
+    the user cannot be asked for confirmation.
+    """
 
 
 class Base:
@@ -13,31 +18,46 @@ class Base:
         label (str): Identifier for the device or mount point.
         hostname (str): Hostname of the current machine.
         name (str): Optional session name.
-        env (dict): Environment variables for the process.
+        env (dict): Extra environment variables for the process.
         mount_drive (MountDrive): Instance for managing mount operations.
     """
 
-    def __init__(self, hostname=None, name=None, check_hostname=True):
-        self.env = setup_environment()
+    def __init__(
+        self, hostname=None, name=None, check_hostname=True, noninteractive=False
+    ):
+        self.env = {}
         self.name = name or "default_session"
 
-        self.hostname = self.confirm_hostname(hostname, check_hostname)
+        self.hostname = self.confirm_hostname(hostname, check_hostname, noninteractive)
 
-    def confirm_hostname(self, hostname, check=True):
+    def confirm_hostname(self, hostname, check=True, noninteractive=False):
         """
         Confirms if the provided hostname matches the current machine's hostname.
         Prompts the user for confirmation if different, allowing to exit or continue.
 
+        In non-interactive mode, or when the BARE_NONINTERACTIVE environment variable is
+        set, a mismatch raises instead of prompting, so unattended and parallel runs never
+        block on stdin.
+
         Parameters:
             hostname (str): The hostname to confirm.
+            check (bool): If False, the hostname is returned without checking it.
+            noninteractive (bool): If True, never prompt the user.
 
         Returns:
             str: The confirmed hostname or the current machine's hostname if none provided.
+
+        Raises:
+            HostnameMismatchError: If the hostnames differ in non-interactive mode.
         """
         if check:
             current_hostname = get_hostname()
 
             if hostname and hostname != current_hostname:
+                if noninteractive or os.environ.get("BARE_NONINTERACTIVE"):
+                    raise HostnameMismatchError(
+                        f"The hostname {hostname} differs from the current hostname {current_hostname}."
+                    )
                 print("The passed hostname is different from the current hostname!")
                 print("You may overwrite a backup that's not yours.")
                 if input("Do you want to continue? (y/n) ").lower().strip()[:1] == "n":
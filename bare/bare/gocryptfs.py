@@ -1,6 +1,5 @@
-import os
 from .base import Base
-from ..utils import execute_command, dict2args, execute_command_test
+from ..utils import execute_command_argv, execute_command_proot, dict2argv
 
 
 class Gocryptfs(Base):
@@ -16,24 +15,35 @@ class Gocryptfs(Base):
         # Location of the restic repository
         self.path = path
         self.gocryptfs_folder = gocryptfs_folder
-        # Setup the base directory used to access the repository
-        self.cmd = 'gocryptfs -extpass "echo $GOCRYPTFS_PASSWORD" {} {} {}'
+        # Setup the base command, gocryptfs splits the -extpass program itself
+        self.cmd = ["gocryptfs", "-extpass", "echo " + gocryptfs_password]
 
     def run(self, cmd="", args={}, mask=None):
-        cmd = self.cmd.format(dict2args(args, double="-"), self.path, cmd)
-        # return execute_command_test(cmd, self.env, mask)
-        return execute_command(cmd, self.env, mask)
+        argv = self.cmd + dict2argv(args, double="-") + [self.path]
+        if cmd:
+            argv.append(cmd)
+        if mask is None:
+            return execute_command_argv(argv, self.env, stream=True)
+        return execute_command_proot(argv, self.env, mask, stream=True)
 
     def init(self):
-        self.run({"init": ""})
+        self.run(args={"init": ""})
 
     def mount(self, destination, args={}, mask=None):
         self.run(destination, args, mask)
 
-    def __getattr__(self, name):
-        # This method is called when an undefined attribute/method is accessed
+    def _command(self, name):
         def method(**kwargs):
             # Redirect the call to the 'run' method with the method name as the command
             return self.run(name, args=kwargs)
 
         return method
+
+    def __getattr__(self, name):
+        # This method is called when an undefined attribute/method is accessed
+        if name.startswith("__"):
+            raise AttributeError(name)
+        # Cache the generated method so later accesses skip this fallback
+        method = self._command(name)
+        setattr(self, name, method)
+        return method
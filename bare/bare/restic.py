@@ -1,10 +1,35 @@
 import os
+import shlex
 import platform
 from .base import Base
-from ..utils import execute_command, dict2args, execute_command_test
+from ..utils import (
+    execute_command_argv,
+    execute_command_proot,
+    dict2argv,
+    expand_path,
+    join_argv,
+    tree_fingerprint,
+    load_fingerprint,
+    store_fingerprint,
+)
 
 
 class Restic(Base):
+    # Restic sub-commands without a dedicated method, bound once per instance
+    COMMANDS = [
+        "prune",
+        "snapshots",
+        "unlock",
+        "stats",
+        "ls",
+        "find",
+        "cat",
+        "tag",
+        "diff",
+        "rewrite",
+        "copy",
+    ]
+
     def __init__(
         self,
         path,
@@ -14,18 +39,23 @@ class Restic(Base):
         name=None,
         check_hostname=True,
         runner="restic",
+        destination=None,
+        noninteractive=False,
     ):
-        super().__init__(hostname, name, check_hostname)
+        super().__init__(hostname, name, check_hostname, noninteractive)
         # Restic password -> TODO: better way to store the password
         self.env["RESTIC_PASSWORD"] = restic_password
         # Location of the restic repository
         self.path = path
         self.restic_folder = restic_folder
+        # Logical destination (e.g. a volume label) identifying the repository across
+        # runs, as `path` may be a mount point that changes every time
+        self.destination = destination
 
         # Setup the runner restic/rustic
         self.runner = runner  # alternative "rustic"
-        self.restic_cmd = "restic {} {} {}"
-        self.rustic_cmd = "rustic {} {} {} --password " + restic_password
+        self.restic_cmd = ["restic"]
+        self.rustic_cmd = ["rustic", "--password", restic_password]
         if self.runner == "restic":
             self.cmd = self.restic_cmd
         else:
@@ -33,71 +63,216 @@ class Restic(Base):
 
         # Setup the base directory used to access the repository
         if len(restic_folder) > 0:
-            self.repo = f"-r {os.path.join(path, restic_folder)}"
+            self.repo = ["-r", os.path.join(path, restic_folder)]
         else:
-            self.repo = f"-r {path}"
+            self.repo = ["-r", path]
+
+        for name in self.COMMANDS:
+            setattr(self, name, self._command(name))
+
+    @classmethod
+    def for_repo(cls, repo, restic_password, **kwargs):
+        """
+        Creates an instance for an already resolved repository location, such as
+        a REST server URL, without appending a restic folder to it.
+
+        Parameters:
+            repo (str): The repository location passed to `-r`.
+            restic_password (str): Password of the repository.
+            **kwargs: Remaining arguments of the constructor.
 
-    def run(self, cmd, args={}, mask=None, dry_run=False, custom_runner=None):
+        Returns:
+            Restic: The runner for the repository.
+        """
+        return cls(repo, restic_password, restic_folder="", **kwargs)
+
+    def run(
+        self,
+        cmd,
+        args={},
+        mask=None,
+        dry_run=False,
+        custom_runner=None,
+        capture=True,
+        ignore_error=True,
+    ):
         print("Context: {}".format(self.name))
         # Select runner
         runner = self.cmd if custom_runner is None else custom_runner
-        # Build command
-        cmd = runner.format(self.repo, cmd, dict2args(args))
+        # Build command, the sub-command may be a string or an argument list
+        if isinstance(cmd, str):
+            cmd = shlex.split(cmd)
+        # Options may come already serialized to reuse them across calls
+        if not isinstance(args, list):
+            args = dict2argv(args)
+        argv = runner + self.repo + list(cmd) + args
         if dry_run:
-            cmd += " --dry-run"
-        # return execute_command_test(cmd, self.env, mask)
-        print(cmd)
-        return execute_command(cmd, self.env, mask, ignore_error=True)
+            argv.append("--dry-run")
+        print(join_argv(argv))
+        # Only masked runs pay for the proot wrapper
+        if mask is None:
+            return execute_command_argv(
+                argv, self.env, ignore_error, capture, stream=True
+            )
+        return execute_command_proot(
+            argv, self.env, mask, ignore_error, capture, stream=True
+        )
 
     def init(self):
         self.run("init")
 
-    def backup(self, source, args={}, mask=None, dry_run=False):
+    def backup(self, source, args={}, mask=None, dry_run=False, skip_unchanged=False):
+        if not skip_unchanged or dry_run:
+            return self._backup(source, args, mask, dry_run)
+
+        # Skip sources whose files did not change since the last backup
+        fingerprints = self._changed_fingerprints([source], mask, args)
+        if not fingerprints:
+            print(f"Restic: {source} is unchanged, skipping.")
+            return
+        # Only remember the fingerprint once restic reports success
+        try:
+            self._backup(source, args, mask, dry_run, ignore_error=False)
+        except Exception as e:
+            print(f"Restic: backup of {source} failed: {e}")
+            return
+        self._store_fingerprints(fingerprints)
+
+    def backup_many(
+        self, sources, args={}, masks=None, dry_run=False, skip_unchanged=False
+    ):
+        """
+        Backs up several sources, sending every unmasked source to a single restic
+        run so the repository is opened once. Masked sources need their own run.
+
+        Parameters:
+            sources (list): The paths to back up.
+            args (dict or list): Additional restic options.
+            masks (list, optional): The mask of each source, None for unmasked ones.
+            dry_run (bool): If True, perform a trial run with no changes made.
+            skip_unchanged (bool): If True, skip the batch when none of its sources
+                changed since the last backup. If any of them did, the whole batch is
+                backed up, so every snapshot keeps the same paths (restic needs them to
+                find the parent snapshot and to group snapshots when forgetting).
+        """
+        masks = masks or [None] * len(sources)
+        batch = [source for source, mask in zip(sources, masks) if mask is None]
+        for source, mask in zip(sources, masks):
+            if mask is not None:
+                self.backup(source, args, mask, dry_run, skip_unchanged)
+
+        fingerprints = None
+        if skip_unchanged and not dry_run:
+            fingerprints = self._changed_fingerprints(batch, None, args)
+            if batch and not fingerprints:
+                print(f"Restic: {', '.join(batch)} are unchanged, skipping.")
+                return
+        if not batch:
+            return
+
+        base_cmd = ["backup"] + [expand_path(source) for source in batch]
         if self.hostname is not None:
-            base_cmd = f"backup {source} --host {self.hostname} "
+            base_cmd += ["--host", self.hostname]
+        try:
+            self.run(
+                base_cmd,
+                args,
+                None,
+                dry_run,
+                capture=False,
+                ignore_error=fingerprints is None,
+            )
+        except Exception as e:
+            print(f"Restic: backup of {', '.join(batch)} failed: {e}")
+            return
+        if fingerprints:
+            self._store_fingerprints(fingerprints)
+
+    def _changed_fingerprints(self, sources, mask, args):
+        """
+        Fingerprints the sources and reports those that changed since the last
+        successful backup. The runner and the restic options are part of the cache
+        key, so changing them (e.g. new excludes) triggers a new backup.
+
+        Returns:
+            dict: Changed sources mapped to their (cache key, fingerprint) pair.
+        """
+        if self.destination is None:
+            repository = self.repo[1]
         else:
-            base_cmd = f"backup {source} "
+            repository = os.path.join(self.destination, self.restic_folder)
+        options = args if isinstance(args, list) else dict2argv(args)
+        context = [repository, self.hostname, mask, self.runner] + options
+        changed = {}
+        for source in sources:
+            key = "\0".join(map(str, [source] + context))
+            fingerprint = tree_fingerprint(source)
+            if fingerprint is None or fingerprint != load_fingerprint(key):
+                changed[source] = (key, fingerprint)
+        return changed
+
+    def _store_fingerprints(self, fingerprints):
+        for key, fingerprint in fingerprints.values():
+            if fingerprint is not None:
+                store_fingerprint(key, fingerprint)
+
+    def _backup(self, source, args, mask, dry_run, ignore_error=True):
+        base_cmd = ["backup", expand_path(source)]
+        if self.hostname is not None:
+            base_cmd += ["--host", self.hostname]
+        as_path = ["--as-path", mask] if mask is not None else []
+        # The progress output of a backup is only streamed, not kept in memory
+        options = {"capture": False, "ignore_error": ignore_error}
         # Rustic
         if self.runner == "rustic":
-            self.run(base_cmd + f"--as-path {mask}", args, None, dry_run)
+            self.run(base_cmd + as_path, args, None, dry_run, **options)
         else:
             # For MacOS we cannot use proot so it goes back to rustic
             if mask is not None and platform.system() == "Darwin":
                 self.run(
-                    base_cmd + f"--as-path {mask}",
+                    base_cmd + as_path,
                     args,
                     None,
                     dry_run,
                     custom_runner=self.rustic_cmd,
+                    **options,
                 )
             else:
                 # Uses proot
-                self.run(base_cmd, args, mask, dry_run)
+                self.run(base_cmd, args, mask, dry_run, **options)
 
     def forget(self, options, hostname_filter=True, dry_run=False):
         # Base command for forgetting and pruning backups
-        base_cmd = "forget --prune "
+        base_cmd = ["forget", "--prune"]
         # Append the host filter to the command if the hostname is set
         if self.hostname is not None and hostname_filter:
-            base_cmd += "--host " + self.hostname
+            base_cmd += ["--host", self.hostname]
 
         self.run(base_cmd, args=options, dry_run=dry_run)
 
     def check(self, options, dry_run=False):
         # Base command for forgetting and pruning backups
-        base_cmd = "check "
+        base_cmd = ["check"]
         self.run(base_cmd, args=options, dry_run=dry_run)
 
     def mount(self, destination, args={}, mask=None, dry_run=False):
         # Currently rustic does not support the mount option.
         self.run(
-            f"mount {destination}", args, mask, dry_run, custom_runner=self.restic_cmd
+            ["mount", destination], args, mask, dry_run, custom_runner=self.restic_cmd
         )
 
-    def __getattr__(self, name):
-        # This method is called when an undefined attribute/method is accessed
+    def _command(self, name):
         def method(**kwargs):
             # Redirect the call to the 'run' method with the method name as the command
             return self.run(name, args=kwargs)
 
         return method
+
+    def __getattr__(self, name):
+        # This method is called when an undefined attribute/method is accessed
+        if name.startswith("__"):
+            raise AttributeError(name)
+        # Cache the generated method so later accesses skip this fallback
+        method = self._command(name)
+        setattr(self, name, method)
+        return method
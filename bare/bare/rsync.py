@@ -1,6 +1,6 @@
 import os
 from .base import Base
-from ..utils import execute_command, dict2args, execute_command_test
+from ..utils import dict2argv, execute_command_test, expand_path
 
 
 class Rsync(Base):
@@ -12,27 +12,66 @@ class Rsync(Base):
         hostname=None,
         name=None,
         check_hostname=False,
+        whole_file=None,
+        compress=None,
+        noninteractive=False,
     ):
-        super().__init__(hostname, name, check_hostname)
+        super().__init__(hostname, name, check_hostname, noninteractive)
         # Location of the folder to receive the backup
         self.dest = os.path.join(path, hostname, rsync_folder)
-        # Setup the base rsync command. the first {} is for the optional args
-        # and the second for the source path
-        self.base_cmd = f"rsync -{file_options} --info=progress2 --numeric-ids"
-        self.base_cmd = self.base_cmd + " {} {} " + self.dest
+        # Local copies are faster without the delta algorithm, while remote
+        # ones benefit from it and from compression. None means auto-detect.
+        remote = self.is_remote(self.dest)
+        whole_file = not remote if whole_file is None else whole_file
+        compress = remote if compress is None else compress
+        # Setup the base rsync command, the optional args and the source path
+        # are appended before the destination on each run
+        self.base_cmd = [
+            "rsync",
+            f"-{file_options}",
+            "--info=progress2",
+            "--numeric-ids",
+        ]
+        if whole_file:
+            self.base_cmd.append("-W")
+        if compress:
+            self.base_cmd += ["-z", "--compress-level=3"]
+
+    @staticmethod
+    def is_remote(dest):
+        """
+        Checks whether an rsync destination points to another host, following
+        rsync's rule that a colon before the first slash denotes a remote path.
+
+        Parameters:
+            dest (str): The rsync destination.
+
+        Returns:
+            bool: True for remote shell (host:path) or rsync daemon destinations.
+        """
+        return dest.startswith("rsync://") or ":" in dest.split("/", 1)[0]
 
     def run(self, source_path, args={}, mask=None, dry_run=False):
         print("Context: {}".format(self.name))
-        cmd = self.base_cmd.format(dict2args(args), source_path)
+        cmd = self.base_cmd + dict2argv(args)
         if dry_run:
-            cmd += " --dry-run"
+            cmd.append("--dry-run")
+        cmd += [expand_path(source_path), self.dest]
         return execute_command_test(cmd, None, mask)
 
     def backup(
-        self, source, args={}, delete=True, ignore_error=True, mask=None, dry_run=False
+        self,
+        source,
+        args=None,
+        delete=True,
+        ignore_error=True,
+        mask=None,
+        dry_run=False,
     ):
+        # Work on a copy so the caller's options are left untouched
+        flags = dict(args or {})
         if delete:
-            args["delete"] = ""
+            flags["delete"] = ""
         if ignore_error:
-            args["ignore-errors"] = ""
-        self.run(source, args, mask, dry_run)
+            flags["ignore-errors"] = ""
+        self.run(source, flags, mask, dry_run)
@@ -3,14 +3,26 @@
 import os
 import yaml
 import argparse
-import copy
+import pickle
 import collections.abc
-from bare import Restic, Rsync, DestinationHandler
-from bare import MountManager
-from .utils import get_hostname
+from concurrent.futures import ThreadPoolExecutor
+
+# The runners, mounters and finders are imported by the commands using them,
+# so e.g. `bare list` does not load them
+from .bare.base import HostnameMismatchError
+from .utils import get_hostname, dict2argv
+
+# Prefer the libyaml-backed loader when PyYAML was built with it
+try:
+    from yaml import CSafeLoader as _Loader
+except ImportError:
+    from yaml import SafeLoader as _Loader
 
 # from utils import get_hostname, Backup, Restic, Mount, DestinationHandler
 
+# Resolved once and shared by every subparser default
+_HOSTNAME = get_hostname()
+
 
 def update_nested(d, u):
     """
@@ -19,11 +31,18 @@ def update_nested(d, u):
     """
     if d is None:
         return u
-    for k, v in u.items():
-        if isinstance(v, collections.abc.Mapping):
-            d[k] = update_nested(d.get(k, {}), v)
-        else:
-            d[k] = v
+    # Walk the nested levels with an explicit stack instead of recursing
+    stack = [(d, u)]
+    while stack:
+        dd, uu = stack.pop()
+        for k, v in uu.items():
+            sub = dd.get(k)
+            if isinstance(v, collections.abc.Mapping) and isinstance(
+                sub, collections.abc.MutableMapping
+            ):
+                stack.append((sub, v))
+            else:
+                dd[k] = v
     return d
 
 
@@ -40,6 +59,8 @@ default_var = {
         "enable": True,
         "forget": None,
         "skip-maintain": False,
+        "skip-unchanged": False,
+        "batch-sources": False,
     },
     "rsync": {
         "password": None,
@@ -48,34 +69,52 @@ default_var = {
         "rsync_folder": "rsync",
     },
     "check_hostname": False,
+    "parallel_sources": False,
 }
 
+# Serialized once, unpickling it is a cheaper fresh copy than deepcopy
+_DEFAULT_BLOB = pickle.dumps(default_var)
 
-def get_restic_instance(config, destination_path, name, destination_type=None):
-    if destination_type == "restic_rest_server":
-        restic_folder = ""
-    else:
-        restic_folder = config["restic"]["restic_folder"]
-    restic_instance = Restic(
-        destination_path,
-        config["restic"]["password"],
-        restic_folder=restic_folder,
+
+def get_restic_instance(
+    config, destination_path, name, destination_type=None, noninteractive=False
+):
+    from .bare.restic import Restic
+
+    options = dict(
+        destination=config["destination"],
         hostname=config["hostname"],
         name=name,
         check_hostname=config["check_hostname"],
         runner=config["restic"]["runner"],
+        noninteractive=noninteractive,
     )
+    if destination_type == "restic_rest_server":
+        # The REST server URL already is the repository
+        restic_instance = Restic.for_repo(
+            destination_path, config["restic"]["password"], **options
+        )
+    else:
+        restic_instance = Restic(
+            destination_path,
+            config["restic"]["password"],
+            restic_folder=config["restic"]["restic_folder"],
+            **options,
+        )
     print(config)
     return restic_instance
 
 
-def get_rsync_instance(config, destination_path, name):
+def get_rsync_instance(config, destination_path, name, noninteractive=False):
+    from .bare.rsync import Rsync
+
     rsync_instance = Rsync(
         destination_path,
         rsync_folder=config["rsync"]["rsync_folder"],
         hostname=config["hostname"],
         name=name,
         check_hostname=config["check_hostname"],
+        noninteractive=noninteractive,
     )
     return rsync_instance
 
@@ -95,61 +134,154 @@ def post_backup_restic(restic_instance, config):
             print("Restic: Finished checking repository!")
 
 
-def backup(var):
+def source_masks(sources, mask):
+    """
+    Pair each source with its mask, a list holds one mask per source.
+    """
+    return [mask[i] if isinstance(mask, list) else mask for i in range(len(sources))]
+
+
+def run_sources(func, sources, mask, parallel=False):
+    """
+    Call `func(source, mask)` for each source, pairing it with its mask. When
+    `parallel` is set the calls run concurrently, as each one only waits on an
+    independent restic/rsync subprocess.
+    """
+    masks = source_masks(sources, mask)
+    if parallel and len(sources) > 1:
+        workers = min(len(sources), os.cpu_count() or 1)
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            list(executor.map(func, sources, masks))
+    else:
+        for source, mask_i in zip(sources, masks):
+            func(source, mask_i)
+
+
+def backup_entry(name, config, total=1, noninteractive=False):
+    """
+    Perform the Restic and Rsync backups of a single session entry.
+
+    Args:
+        name (str): Name of the session entry.
+        config (dict): Configuration of the entry.
+        total (int): Number of entries being backed up, used for error messages.
+        noninteractive (bool): If True, a hostname mismatch skips the entry instead
+            of prompting.
+    """
+    from .destination_handler import DestinationHandler
+
+    print(f"Starting backup for {name} to {config['destination']}")
+    try:
+        dh = DestinationHandler(config["destination"])
+        with dh as destination_path:
+            if config["restic"]["enable"]:
+                print("Starting restic backup!")
+                restic_instance = get_restic_instance(
+                    config, destination_path, name, dh.destination_type, noninteractive
+                )
+                # Serialize the options once for all the sources
+                args = dict2argv(config["restic"]["args"])
+                skip = config["restic"]["skip-unchanged"]
+                if config["restic"]["batch-sources"]:
+                    restic_instance.backup_many(
+                        config["source"],
+                        args,
+                        source_masks(config["source"], config["mask"]),
+                        skip_unchanged=skip,
+                    )
+                else:
+                    run_sources(
+                        lambda source, mask: restic_instance.backup(
+                            source, args, mask, skip_unchanged=skip
+                        ),
+                        config["source"],
+                        config["mask"],
+                        config["parallel_sources"],
+                    )
+                print("Restic backup done!")
+                post_backup_restic(restic_instance, config)
+            if (
+                config["rsync"]["enable"]
+                and dh.destination_type != "restic_rest_server"
+            ):
+                print("Starting rsync backup!")
+                rsync = get_rsync_instance(
+                    config, destination_path, name, noninteractive
+                )
+                args = config["rsync"]["args"]
+                run_sources(
+                    lambda source, mask: rsync.backup(source, args, mask=mask),
+                    config["source"],
+                    config["mask"],
+                    config["parallel_sources"],
+                )
+                print("Rsync backup done!")
+            elif config["rsync"]["enable"]:
+                print("The destination is a Restic rest server")
+    except HostnameMismatchError as e:
+        print(f"Skipping {name}: {e}")
+    except AssertionError as e:
+        print(f"Error during backup: {e}")
+        if "Unable to find" in str(e):
+            if total > 1:
+                print("Skipping to the next drive.")
+
+
+def backup(var, parallel=1):
     """
     Perform backup operations using the provided configuration. It handles both
     Restic and Rsync backups based on the configuration.
+
+    Args:
+        var (dict): Dictionary with keys as item names and values as their configuration.
+        parallel (int): Number of entries backed up concurrently.
     """
-    for name, config in var.items():
-        print(f"Starting backup for {name} to {config['destination']}")
-        try:
-            dh = DestinationHandler(config["destination"])
-            with dh as destination_path:
-                if config["restic"]["enable"]:
-                    print("Starting restic backup!")
-                    restic_instance = get_restic_instance(
-                        config, destination_path, name, dh.destination_type
-                    )
-                    mask = config["mask"]
-                    args = config["restic"]["args"]
-                    for i, source in enumerate(config["source"]):
-                        mask_i = mask[i] if isinstance(mask, list) else mask
-                        restic_instance.backup(source, args, mask_i)
-                    print("Restic backup done!")
-                    post_backup_restic(restic_instance, config)
-                if (
-                    config["rsync"]["enable"]
-                    and dh.destination_type != "restic_rest_server"
-                ):
-                    print("Starting rsync backup!")
-                    rsync = get_rsync_instance(config, destination_path, name)
-                    mask = config["mask"]
-                    args = config["rsync"]["args"]
-                    for i, source in enumerate(config["source"]):
-                        mask_i = mask[i] if isinstance(mask, list) else mask
-                        rsync.backup(source, args, mask_i)
-                    print("Rsync backup done!")
-                elif config["rsync"]["enable"]:
-                    print("The destination is a Restic rest server")
-        except AssertionError as e:
-            print(f"Error during backup: {e}")
-            if "Unable to find" in str(e):
-                if len(var) > 1:
-                    print("Skipping to the next drive.")
+    if parallel > 1 and len(var) > 1:
+        # Entries sharing a destination run in order to avoid racing on its mount
+        groups = {}
+        for name, config in var.items():
+            groups.setdefault(config["destination"], []).append(name)
+
+        def run_group(names):
+            for name in names:
+                # Concurrent entries cannot share stdin for the hostname prompt
+                backup_entry(name, var[name], len(var), noninteractive=True)
+
+        with ThreadPoolExecutor(max_workers=parallel) as executor:
+            list(executor.map(run_group, groups.values()))
+    else:
+        for name, config in var.items():
+            backup_entry(name, config, len(var))
 
 
 def restic(var, unknown):
     """
-    Execute a Restic command for each configuration entry.
+    Execute a Restic command for each configuration entry. Entries pointing at a
+    repository that was already queried are skipped, as restic would load the
+    same index to print the same result.
     """
+    from .destination_handler import DestinationHandler
+
+    queried = set()
     for name, config in var.items():
+        repository = (
+            config["destination"],
+            config["restic"]["restic_folder"],
+            config["restic"]["runner"],
+        )
+        if repository in queried:
+            print(f"Skipping {name}, its repository was already used.")
+            continue
+        queried.add(repository)
         try:
             dh = DestinationHandler(config["destination"])
             with dh as destination_path:
                 restic_instance = get_restic_instance(
                     config, destination_path, name, dh.destination_type
                 )
-                _ = restic_instance.run(" ".join(unknown))
+                _ = restic_instance.run(unknown)
+        except HostnameMismatchError as e:
+            print(f"Skipping {name}: {e}")
         except AssertionError as e:
             print(f"Error during Restic command: {e}")
             if "Unable to find" in str(e):
@@ -164,6 +296,8 @@ def maintain(var):
     Args:
         var (dict): Dictionary with keys as item names and values as their configuration.
     """
+    from .destination_handler import DestinationHandler
+
     for name, config in var.items():
         print(f"Starting maintenance for {name} to {config['destination']}")
 
@@ -187,6 +321,8 @@ def maintain(var):
                 elif config["rsync"]["enable"]:
                     print("The destination is a Restic rest server")
 
+        except HostnameMismatchError as e:
+            print(f"Skipping {name}: {e}")
         except AssertionError as e:
             print(f"Error during backup: {e}")
 
@@ -198,6 +334,8 @@ def umount(var):
     """
     Unmount and clean the temporary folders created during the backup.
     """
+    from .mount_manager import MountManager
+
     try:
         mount_mgmt = MountManager()
         mount_mgmt.umount_all()
@@ -213,7 +351,7 @@ def list_func(var, unknown):
     print(yaml.dump(list(var.keys())))
 
 
-def router(cmd, var, unknown, target):
+def router(cmd, var, unknown, target, parallel=1):
     """
     Main function to route commands to the appropriate function.
     """
@@ -224,7 +362,7 @@ def router(cmd, var, unknown, target):
             var = {k: v for k, v in var.items() if k == target}
 
         if cmd == "backup":
-            backup(var)
+            backup(var, parallel)
         elif cmd == "restic":
             restic(var, unknown)
         elif cmd == "umount":
@@ -248,7 +386,7 @@ def main():
     )
     backupparser.add_argument(
         "--hostname",
-        default=get_hostname(),
+        default=_HOSTNAME,
         nargs="?",
         help="Computer name to be the backup parent folder, default is the current computer name.",
     )
@@ -276,6 +414,12 @@ def main():
         nargs="?",
         help="Custom session file to be used.",
     )
+    backupparser.add_argument(
+        "--parallel",
+        default=1,
+        type=int,
+        help="Number of session entries backed up concurrently, default is 1. Entries sharing a destination always run in order.",
+    )
     backupparser.add_argument(
         "--target",
         default=None,
@@ -290,7 +434,7 @@ def main():
     )
     resticparser.add_argument(
         "--hostname",
-        default=get_hostname(),
+        default=_HOSTNAME,
         nargs="?",
         help="Computer name to be the backup parent folder, default is the current computer name.",
     )
@@ -326,7 +470,7 @@ def main():
     )
     umountparser.add_argument(
         "--hostname",
-        default=get_hostname(),
+        default=_HOSTNAME,
         nargs="?",
         help="Computer name to be the backup parent folder, default is the current computer name.",
     )
@@ -376,24 +520,28 @@ def main():
 
     if os.path.exists(session_file):
         with open(session_file) as f:
-            session = yaml.load(f, Loader=yaml.FullLoader)
+            session = yaml.load(f, Loader=_Loader)
     elif os.path.exists(session_home):
         with open(session_home) as f:
-            session = yaml.load(f, Loader=yaml.FullLoader)
+            session = yaml.load(f, Loader=_Loader)
     else:
         session = {}
 
     # Combine command-line arguments and session configuration
     cmd = var.pop("command")
+    parallel = var.pop("parallel", 1)
     var = {"cmdline": var}
     var.update(session)
 
     # Clean and validate configuration
-    var = {k: v for k, v in var.items() if v and v.get("destination")}
-    var = {k: update_nested(copy.deepcopy(default_var), v) for k, v in var.items()}
+    var = {
+        k: update_nested(pickle.loads(_DEFAULT_BLOB), v)
+        for k, v in var.items()
+        if v and v.get("destination")
+    }
 
     if var:
-        router(cmd, var, unknown, target)
+        router(cmd, var, unknown, target, parallel)
 
 
 if __name__ == "__main__":
@@ -1,7 +1,5 @@
 import os
-from urllib.parse import urlparse
 from .mount.drive import MountDrive
-from .finder.devices import DeviceFinder
 
 
 class DestinationHandler:
@@ -17,10 +15,19 @@ class DestinationHandler:
         self.destination = destination
         self.relative_path = relative_path
         self.crypt = crypt
-        self.mounter = MountDrive()
+        self._mounter = None
         self.do_i_mounted = False
         self.destination_type = self.detect_destination_type()
 
+    @property
+    def mounter(self):
+        """
+        MountDrive instance, only created for destinations that need mounting.
+        """
+        if self._mounter is None:
+            self._mounter = MountDrive()
+        return self._mounter
+
     def detect_destination_type(self):
         """
         Detects the type of destination based on the provided destination.
@@ -29,13 +36,13 @@ class DestinationHandler:
         str: The type of destination ('volume', 'abs_path', or 'restic_rest_server').
         """
         # Check if it's a Restic REST server URL
-        if self.destination.startswith("rest:"):
-            parsed_url = urlparse(self.destination[5:])  # Strip 'rest:' and parse URL
-            if parsed_url.scheme in ["http", "https"]:
-                return "restic_rest_server"
+        if self.destination.startswith(("rest:http://", "rest:https://")):
+            return "restic_rest_server"
 
         # Check if it's a volume label
-        if not os.path.isabs(self.destination) and not os.path.exists(self.destination):
+        if not os.path.isabs(self.destination) and not os.access(
+            self.destination, os.F_OK
+        ):
             return "volume"
 
         # Otherwise, assume it's an absolute path
@@ -68,8 +75,13 @@ class DestinationHandler:
         Raises:
             RuntimeError: If no mount points are found for the volume label.
         """
-        self.do_i_mounted = self.mounter.mount(self.destination)
         mount_points = self.mounter.get_mountpoint(self.destination)
+        if mount_points:
+            # Mounted by someone else, so it is left mounted on exit
+            self.do_i_mounted = False
+        else:
+            self.do_i_mounted = self.mounter.mount(self.destination)
+            mount_points = self.mounter.get_mountpoint(self.destination)
         if not mount_points:
             raise RuntimeError(
                 f"No mount points found for volume label: {self.destination}"
@@ -88,7 +100,7 @@ class DestinationHandler:
         Raises:
             FileExistsError: If the absolute path does not exist.
         """
-        if os.path.exists(self.destination):
+        if os.access(self.destination, os.F_OK):
             return self.destination
         else:
             raise FileExistsError(f"The path {self.destination} must exist.")
@@ -113,6 +125,9 @@ class DestinationHandler:
         """
         Support for context manager entry. Attempts to mount the drive if necessary.
         """
+        # Plain paths never touch the mounter
+        if self.destination_type == "abs_path" and self.crypt is None:
+            return self._check_abs_path()
         return self.mount()
 
     def __exit__(self, exc_type, exc_val, exc_tb):
@@ -1,13 +1,15 @@
+import os
 import platform
-import json
-import plistlib
+from concurrent.futures import ThreadPoolExecutor
 
-from ..utils import execute_command
+from ..utils import parse_mount
 
 from .physical import DriveFinder
 from .rclone import RcloneFinder
 from .gocryptfs import GocryptfsFinder
 
+_SYSTEM = platform.system()
+
 
 class DeviceFinder:
     """
@@ -15,46 +17,158 @@ class DeviceFinder:
     Dynamically selects the appropriate method for the current operating system.
     """
 
+    KINDS = ("physical", "rclone", "gocryptfs")
+
     def __init__(self, label=None):
         self.label = label
+        self._mounts = None
+        self._devices = {}
+        self._indexes = {}
 
-    def get_all_devices(self):
+    def _get_mounts(self):
+        """
+        Retrieves the mount table shared by the virtual drive finders, reading it only once.
+
+        Returns:
+            list of dict or None: The parsed mount table, None where it is not supported.
+        """
+        if self._mounts is None and _SYSTEM in ["Linux", "Darwin"]:
+            self._mounts = parse_mount()
+        return self._mounts
+
+    def get_devices(self, kind):
+        """
+        Retrieves the drives of a single kind. The result is cached until `invalidate`
+        is called, so repeated lookups do not rerun the discovery commands.
+
+        Args:
+            kind (str): One of 'physical', 'rclone' or 'gocryptfs'.
+
+        Returns:
+            list of dict: A list of dictionaries, each representing a drive.
+        """
+        if kind not in self._devices:
+            if kind == "physical":
+                finder = DriveFinder()
+            elif kind == "rclone":
+                finder = RcloneFinder(self._get_mounts())
+            elif kind == "gocryptfs":
+                finder = GocryptfsFinder(self._get_mounts())
+            else:
+                raise ValueError(f"Unknown device kind: {kind}")
+            self._devices[kind] = finder.get_drives()
+        return self._devices[kind]
+
+    def get_all_devices(self, want=None):
         """
         Retrieves a list of all drives.
 
+        Args:
+            want (str, optional): Restricts the discovery to one kind ('physical', 'rclone'
+                or 'gocryptfs'), so the other finders are not run.
+
         Returns:
             list of dict: A list of dictionaries, each representing a drive.
         """
+        kinds = (want,) if want else self.KINDS
+        missing = [kind for kind in kinds if kind not in self._devices]
+        if len(missing) > 1:
+            # The finders mostly wait on external commands, so they run side by side.
+            # The mount table is read beforehand so the threads share one copy.
+            self._get_mounts()
+            with ThreadPoolExecutor(max_workers=len(missing)) as executor:
+                list(executor.map(self.get_devices, missing))
 
-        finders = [DriveFinder(), RcloneFinder(), GocryptfsFinder()]
         drives = []
-        for s in finders:
-            drives.extend(s.get_drives())
+        for kind in kinds:
+            drives.extend(self.get_devices(kind))
         return drives
 
-    def find_device(self, label=None, name=None, path=None):
+    def invalidate(self):
+        """
+        Discards the cached drives, to be called after mounting or unmounting.
+        """
+        self._mounts = None
+        self._devices = {}
+        self._indexes = {}
+
+    def _get_index(self, kind):
+        """
+        Retrieves the lookup tables for the drives of a single kind, built once per cached
+        device list. Each table maps a name, label or mountpoint to the positions of the
+        matching drives.
+
+        Args:
+            kind (str): One of 'physical', 'rclone' or 'gocryptfs'.
+
+        Returns:
+            dict: The 'name', 'label' and 'mount' lookup tables.
+        """
+        if kind not in self._indexes:
+            index = {"name": {}, "label": {}, "mount": {}}
+            for pos, device in enumerate(self.get_devices(kind)):
+                index["name"].setdefault(device["name"], []).append(pos)
+                index["label"].setdefault(device["label"], []).append(pos)
+                for mountpoint in device["mountpoints"]:
+                    index["mount"].setdefault(mountpoint, []).append(pos)
+            self._indexes[kind] = index
+        return self._indexes[kind]
+
+    def _search_order(self, label=None, path=None):
+        """
+        Orders the device kinds so the most likely one for the given label or mountpoint
+        is searched first. Rclone remotes end with ':', gocryptfs drives are labelled by
+        their absolute cipher directory and mountpoints are looked up in the mount table.
+
+        Returns:
+            list of str: The device kinds in the order they should be searched.
+        """
+        first = "physical"
+        if label and label.endswith(":"):
+            first = "rclone"
+        elif label and os.path.isabs(label):
+            first = "gocryptfs"
+        elif path:
+            for mount in self._get_mounts() or []:
+                if mount["dst"] == path:
+                    if mount["fstype"] == "fuse.rclone":
+                        first = "rclone"
+                    elif mount["fstype"] == "fuse.gocryptfs":
+                        first = "gocryptfs"
+                    break
+        return [first] + [kind for kind in self.KINDS if kind != first]
+
+    def find_device(self, label=None, name=None, path=None, want=None):
         """
         Searches both physical and rclone drives for a device matching the given label or name or mountpoint (path).
+        The kinds are searched one at a time and the search stops at the first kind with a match,
+        so the remaining discovery commands are not run.
 
         Args:
             label (str, optional): The label of the device to find. Defaults to the instance's label.
             name (str, optional): The name of the device to find.
             path (str, optional): The mountpoint of the device to find.
+            want (str, optional): Only searches drives of this kind ('physical', 'rclone' or 'gocryptfs').
 
         Returns:
             list of dict: A list of dictionaries, each representing a found device.
         """
         label = label or self.label
+        if not (label or name or path):
+            return []
 
-        devices = self.get_all_devices()
-        filtered_devices = []
-
-        for device in devices:
-            if name and device["name"] == name:
-                filtered_devices.append(device)
-            elif label and device["label"] == label:
-                filtered_devices.append(device)
-            elif path and path in device["mountpoints"]:
-                filtered_devices.append(device)
+        kinds = (want,) if want else self._search_order(label, path)
+        for kind in kinds:
+            index = self._get_index(kind)
+            positions = set()
+            if name:
+                positions.update(index["name"].get(name, []))
+            if label:
+                positions.update(index["label"].get(label, []))
+            if path:
+                positions.update(index["mount"].get(path, []))
+            if positions:
+                devices = self.get_devices(kind)
+                return [devices[pos] for pos in sorted(positions)]
 
-        return filtered_devices
+        return []
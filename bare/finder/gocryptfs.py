@@ -1,20 +1,40 @@
 import platform
 from ..utils import parse_mount
 
+_SYSTEM = platform.system()
+
 
 class GocryptfsFinder:
     """
     A class dedicated to finding and formatting gocryptfs mounted drives on the system.
     """
 
+    def __init__(self, mounts=None):
+        """
+        Parameters:
+            mounts (list of dict, optional): An already parsed mount table, as returned by
+                `parse_mount`. When omitted the table is read on demand.
+        """
+        self.mounts = mounts
+
     def get_drives(self):
         """
-        Public method to get formatted gocryptfs drive details.
+        Public method to get formatted gocryptfs drive details. The mount table is
+        filtered and formatted in a single pass.
 
         Returns:
             List[Dict[str, Any]]: A list of dictionaries with formatted drive details.
         """
-        return self._format_finder(self._get_gocryptfs_mounted())
+        return [
+            {
+                "name": "gocryptfs",
+                "label": mount["src"],
+                "fstype": mount["fstype"],
+                "mountpoints": [mount["dst"]],
+            }
+            for mount in self._get_mounted_by_os()
+            if mount["fstype"] == "fuse.gocryptfs"
+        ]
 
     def _get_mounted_by_os(self):
         """
@@ -26,41 +46,11 @@ class GocryptfsFinder:
         Raises:
             NotImplementedError: If the OS is not Linux or Darwin (macOS).
         """
-        os_type = platform.system()
-        if os_type in ["Linux", "Darwin"]:
-            return parse_mount()
+        if _SYSTEM in ["Linux", "Darwin"]:
+            if self.mounts is None:
+                self.mounts = parse_mount()
+            return self.mounts
         else:
             raise NotImplementedError(
                 "Mount point detection not implemented for Windows."
             )
-
-    def _get_gocryptfs_mounted(self):
-        """
-        Filters the mounted drives to find those specifically using 'fuse.gocryptfs'.
-
-        Returns:
-            List[Dict[str, str]]: A filtered list of gocryptfs mount dictionaries.
-        """
-        mounts = self._get_mounted_by_os()
-        return [mount for mount in mounts if mount["fstype"] == "fuse.gocryptfs"]
-
-    def _format_finder(self, drives):
-        """
-        Formats the list of drives into a specified structure.
-
-        Args:
-            drives (List[Dict[str, str]]): List of gocryptfs mount dictionaries.
-
-        Returns:
-            List[Dict[str, Any]]: A list of formatted drive details.
-        """
-        formatted = []
-        for drive in drives:
-            new_drive = {
-                "name": "gocryptfs",
-                "label": drive["src"],
-                "fstype": drive["fstype"],
-                "mountpoints": [drive["dest"]],
-            }
-            formatted.append(new_drive)
-        return formatted
@@ -1,8 +1,17 @@
 import platform
-import json
 import plistlib
 
-from ..utils import execute_command
+try:
+    # Faster drop-in parser for the lsblk output, when available
+    from orjson import loads as _json_loads
+except ImportError:
+    from json import loads as _json_loads
+
+from ..utils import execute_command_argv
+
+_SYSTEM = platform.system()
+_PRIVATE_PREFIX = "/private"
+_PRIVATE_PREFIX_LEN = len(_PRIVATE_PREFIX)
 
 
 class DriveFinderLinux:
@@ -17,7 +26,11 @@ class DriveFinderLinux:
 
     def extract_partitions(self, blks):
         """
-        Identifies and returns all partitions (leaf nodes) from the provided block device structure.
+        Identifies and returns all partitions (leaf nodes) from the provided block device structure,
+        filling in the default mountpoints where lsblk reports none.
+
+        The tree is walked iteratively in depth-first order, so the partitions keep the order
+        in which lsblk lists them.
 
         Args:
             blks (list of dict): The block devices structure as returned by `lsblk -J`.
@@ -26,22 +39,16 @@ class DriveFinderLinux:
             list of dict: A list containing information about each identified partition.
         """
         partitions = []
-        self._recurse_partitions(blks, partitions)
-        return partitions
-
-    def _recurse_partitions(self, nodes, partitions):
-        """
-        Recursively traverses the block device tree to find and append leaf nodes (partitions) to the partitions list.
-
-        Args:
-            nodes (list of dict): The current list of nodes (block devices or partitions) to process.
-            partitions (list of dict): The list to which identified partitions are appended.
-        """
-        for node in nodes:
+        stack = list(reversed(blks))
+        while stack:
+            node = stack.pop()
             if "children" in node:
-                self._recurse_partitions(node["children"], partitions)
-            else:
-                partitions.append(node)
+                stack.extend(reversed(node["children"]))
+                continue
+            if not node.get("mountpoints") or node["mountpoints"] == [None]:
+                node["mountpoints"] = self.DEFAULT_MOUNTPOINTS
+            partitions.append(node)
+        return partitions
 
     def get_physical_drives(self):
         """
@@ -51,18 +58,11 @@ class DriveFinderLinux:
             list of dict: A list of dictionaries, each representing a partition with keys for name,
                           label, mountpoints, and fstype, with missing data filled in with defaults.
         """
-        lsblk_command = "lsblk -o name,label,mountpoints,fstype -J"
-        lsblk_output = execute_command(lsblk_command)
-        blks = json.loads(lsblk_output)["blockdevices"]
+        lsblk_command = ["lsblk", "-o", "name,label,mountpoints,fstype", "-J"]
+        lsblk_output = execute_command_argv(lsblk_command)
+        blks = _json_loads(lsblk_output)["blockdevices"]
 
-        found_devices = self.extract_partitions(blks)
-
-        # Apply default mountpoints where necessary
-        for device in found_devices:
-            if not device.get("mountpoints") or device["mountpoints"] == [None]:
-                device["mountpoints"] = self.DEFAULT_MOUNTPOINTS
-
-        return found_devices
+        return self.extract_partitions(blks)
 
 
 class DriveFinderDarwin:
@@ -96,58 +96,38 @@ class DriveFinderDarwin:
             list of dict: A list of dictionaries, each representing a physical drive or partition
                           with keys for name, label, mountpoints, and fstype.
         """
-        diskutil_command = "diskutil list -plist"
-        diskutil_output = execute_command(diskutil_command)
+        diskutil_command = ["diskutil", "list", "-plist"]
+        diskutil_output = execute_command_argv(diskutil_command)
         disks_info = plistlib.loads(diskutil_output.encode("utf-8"))
 
         found_devices = []
         for disk in disks_info.get("AllDisksAndPartitions", []):
-            device_info = self._parse_disk_info(disk)
-            found_devices.append(device_info)
+            found_devices.append(self._parse_volume_info(disk, self.DEFAULT_LABEL))
 
             # Process partitions if they exist
             for partition in disk.get("Partitions", []):
-                partition_info = self._parse_partition_info(partition)
-                found_devices.append(partition_info)
+                found_devices.append(self._parse_volume_info(partition, "No Label"))
 
         return found_devices
 
-    def _parse_disk_info(self, disk):
+    def _parse_volume_info(self, volume, default_label):
         """
-        Parses disk information, applying defaults and converting filesystem types as necessary.
+        Parses disk or partition information, applying defaults and converting filesystem
+        types as necessary.
 
         Args:
-            disk (dict): The disk information dictionary from `diskutil`.
+            volume (dict): The disk or partition information dictionary from `diskutil`.
+            default_label (str): The label used when the volume has no name.
 
         Returns:
-            dict: A dictionary with processed disk information.
+            dict: A dictionary with processed disk or partition information.
         """
+        content = volume.get("Content", "")
         return {
-            "name": disk.get("DeviceIdentifier"),
-            "label": disk.get("VolumeName", self.DEFAULT_LABEL),
-            "mountpoints": self._parse_mountpoint(disk),
-            "fstype": self.FILESYSTEM_CONVERSION_MAP.get(
-                disk.get("Content", ""), disk.get("Content", "")
-            ),
-        }
-
-    def _parse_partition_info(self, partition):
-        """
-        Parses partition information, applying defaults and converting filesystem types as necessary.
-
-        Args:
-            partition (dict): The partition information dictionary.
-
-        Returns:
-            dict: A dictionary with processed partition information.
-        """
-        return {
-            "name": partition.get("DeviceIdentifier"),
-            "label": partition.get("VolumeName", "No Label"),
-            "mountpoints": self._parse_mountpoint(partition),
-            "fstype": self.FILESYSTEM_CONVERSION_MAP.get(
-                partition.get("Content", ""), partition.get("Content", "")
-            ),
+            "name": volume.get("DeviceIdentifier"),
+            "label": volume.get("VolumeName", default_label),
+            "mountpoints": self._parse_mountpoint(volume),
+            "fstype": _FS_GET(content, content),
         }
 
     def _parse_mountpoint(self, data):
@@ -158,20 +138,27 @@ class DriveFinderDarwin:
             data (dict): A dictionary containing the mount point information.
 
         Returns:
-            list or str: The processed mount point(s), adjusted if prefixed with '/private'.
+            list: The processed mount point(s), adjusted if prefixed with '/private'.
         """
         path = data.get("MountPoint")
-        if path:
-            if platform.system() == "Darwin":
-                prefix = "/private"
-                if path.startswith(prefix):
-                    return [path[len(prefix) :]]  # Slice off the prefix
-                else:
-                    return [path]  # Slice off the prefix
-            else:
-                return path  # Return the original path if not prefixed
-        else:
+        if not path:
             return self.DEFAULT_MOUNTPOINTS
+        # Only used on Darwin, where /tmp and /var resolve under /private.
+        # str.removeprefix would need Python 3.9.
+        if path.startswith(_PRIVATE_PREFIX):
+            path = path[_PRIVATE_PREFIX_LEN:]
+        return [path]
+
+
+_FS_GET = DriveFinderDarwin.FILESYSTEM_CONVERSION_MAP.get
+
+# The finders hold no state, so a single instance serves every lookup
+if _SYSTEM == "Linux":
+    _PLATFORM_FINDER = DriveFinderLinux()
+elif _SYSTEM == "Darwin":
+    _PLATFORM_FINDER = DriveFinderDarwin()
+else:
+    _PLATFORM_FINDER = None
 
 
 class DriveFinder:
@@ -188,16 +175,11 @@ class DriveFinder:
 
     def _get_platform_finder(self):
         """
-        Returns an instance of a platform-specific device finder.
+        Returns the platform-specific device finder, created once at import.
 
         Returns:
             An instance of a subclass of DeviceFinder appropriate for the current OS, or None if unsupported.
         """
-        if platform.system() == "Linux":
-            return DriveFinderLinux()
-        elif platform.system() == "Darwin":
-            return DriveFinderDarwin()
-        elif platform.system() == "Windows":
+        if _SYSTEM == "Windows":
             raise NotImplementedError("Search drives in Windows is not implemented.")
-        else:
-            return None
+        return _PLATFORM_FINDER
@@ -1,15 +1,28 @@
+import os
 import platform
+import configparser
 
-from ..utils import execute_command
+from ..utils import execute_command_argv
+
+_SYSTEM = platform.system()
 
 
 class RcloneFinder:
     """
     Facilitates the discovery of rclone mounted drives.
-    Utilizes the `rclone listremotes` command to list all configured remotes and identifies
-    their mount points on Unix-like operating systems.
+    Lists the configured remotes from the rclone configuration file, falling back to the
+    `rclone listremotes` command, and identifies their mount points on Unix-like operating systems.
     """
 
+    def __init__(self, mounts=None):
+        """
+        Parameters:
+            mounts (list of dict, optional): An already parsed mount table, as returned by
+                `parse_mount`. On Linux the rclone mount points are taken from it instead of
+                scanning the running processes.
+        """
+        self.mounts = mounts
+
     def get_drives(self):
         """
         Retrieves a list of mounted rclone drives, including their labels and filesystem type.
@@ -19,21 +32,76 @@ class RcloneFinder:
             list of dict: A list of dictionaries, each representing a mounted rclone drive
                           with keys for name, label, fstype, and mountpoints.
         """
-        listremotes_command = "rclone listremotes"
-        remotes_output = execute_command(listremotes_command).strip()
-
-        if remotes_output:
-            remotes = remotes_output.split("\n")
+        remotes = self.list_remotes()
 
+        if remotes:
             found_remotes = [
                 {"name": "rclone", "label": remote, "fstype": "fuse.rclone"}
                 for remote in remotes
-                if remote
             ]
             return self._add_mountpoint(found_remotes)
         else:
             return []
 
+    def list_remotes(self):
+        """
+        Lists the configured rclone remotes. The configuration file is read directly and
+        `rclone listremotes` is only run when that is not possible.
+
+        Returns:
+            list of str: The remote names, each ending with ':'.
+        """
+        remotes = self._read_config_remotes()
+        if remotes is None:
+            remotes_output = execute_command_argv(["rclone", "listremotes"]).strip()
+            remotes = [remote for remote in remotes_output.split("\n") if remote]
+        return remotes
+
+    def _config_path(self):
+        """
+        Locates the rclone configuration file the same way rclone does.
+
+        Returns:
+            str: The path of the configuration file.
+        """
+        path = os.environ.get("RCLONE_CONFIG")
+        if path:
+            return path
+        config_home = os.environ.get("XDG_CONFIG_HOME") or os.path.expanduser(
+            "~/.config"
+        )
+        path = os.path.join(config_home, "rclone", "rclone.conf")
+        if os.access(path, os.F_OK):
+            return path
+        return os.path.expanduser("~/.rclone.conf")
+
+    def _read_config_remotes(self):
+        """
+        Reads the remote names from the sections of the rclone configuration file.
+
+        Returns:
+            list of str or None: The remote names, or None if rclone has to be asked instead:
+                the file is missing or encrypted, has no remotes, or remotes are defined
+                through RCLONE_CONFIG_<NAME>_TYPE environment variables.
+        """
+        if any(
+            key.startswith("RCLONE_CONFIG_") and key.endswith("_TYPE")
+            for key in os.environ
+        ):
+            return None
+
+        config = configparser.ConfigParser(interpolation=None, strict=False)
+        try:
+            if not config.read(self._config_path(), encoding="utf-8"):
+                return None
+        except (configparser.Error, UnicodeDecodeError):
+            # An encrypted configuration has no sections to parse
+            return None
+
+        if not config.sections():
+            return None
+        return sorted(f"{section}:" for section in config.sections())
+
     def _add_mountpoint(self, mounts):
         """
         Adds mount point information to each rclone drive based on the operating system.
@@ -44,8 +112,11 @@ class RcloneFinder:
         Returns:
             list of dict: The updated list of rclone drives, including mount points.
         """
-        os_type = platform.system()
-        if os_type in ["Linux", "Darwin"]:
+        if _SYSTEM == "Linux" and self.mounts is not None:
+            mountpoints = {
+                m["src"]: m["dst"] for m in self.mounts if m["fstype"] == "fuse.rclone"
+            }
+        elif _SYSTEM in ["Linux", "Darwin"]:
             mountpoints = self.get_rclone_mountpoint_unix()
         else:
             raise NotImplementedError(
@@ -53,28 +124,73 @@ class RcloneFinder:
             )
 
         for mount in mounts:
-            mount["mountpoints"] = [mountpoints.get(mount["label"], [])]
+            label = mount["label"]
+            mount["mountpoints"] = [mountpoints[label]] if label in mountpoints else []
         return mounts
 
     def get_rclone_mountpoint_unix(self):
         """
-        Retrieves rclone mount points on Unix-like operating systems by parsing the output of
-        the `ps` command to find running rclone mount processes.
+        Retrieves rclone mount points on Unix-like operating systems by finding the running
+        rclone mount processes. On Linux the process arguments are read from /proc, elsewhere
+        the output of the `ps` command is parsed.
+
+        Returns:
+            dict: A dictionary mapping each rclone label to its mount point path.
+        """
+        if _SYSTEM == "Linux" and os.path.isdir("/proc"):
+            return self._get_rclone_mountpoint_proc()
+        return self._get_rclone_mountpoint_ps()
+
+    def _get_rclone_mountpoint_proc(self):
+        """
+        Retrieves rclone mount points by reading the command line of every process in /proc.
+
+        Returns:
+            dict: A dictionary mapping each rclone label to its mount point path.
+        """
+        mountpoints = {}
+        with os.scandir("/proc") as entries:
+            for entry in entries:
+                if not entry.name.isdigit():
+                    continue
+                try:
+                    with open(f"/proc/{entry.name}/cmdline", "rb") as f:
+                        cmdline = f.read()
+                except OSError:
+                    # The process exited meanwhile or is not readable
+                    continue
+                argv = cmdline.decode(errors="replace").rstrip("\0").split("\0")
+                self._add_rclone_argv(argv, mountpoints)
+        return mountpoints
+
+    @staticmethod
+    def _add_rclone_argv(argv, mountpoints):
+        """
+        Records the label and mount point of an `rclone mount` command line, ignoring any
+        other process.
+
+        Args:
+            argv (list of str): The command line of a process.
+            mountpoints (dict): The mapping of rclone labels to mount point paths to update.
+        """
+        if not argv or os.path.basename(argv[0]) != "rclone" or "mount" not in argv:
+            return
+        # Assumes label is always the first argument and path the second after 'mount'
+        idx = argv.index("mount")
+        if len(argv) > idx + 2:
+            mountpoints[argv[idx + 1]] = argv[idx + 2]
+
+    def _get_rclone_mountpoint_ps(self):
+        """
+        Retrieves rclone mount points by parsing the process list printed by the `ps` command.
 
         Returns:
             dict: A dictionary mapping each rclone label to its mount point path.
         """
-        output = execute_command("ps -aux | grep 'rclone mount'").split("\n")
+        output = execute_command_argv(["ps", "-ax", "-o", "command="])
         mountpoints = {}
 
-        for line in output:
-            if "rclone mount" in line:
-                parts = line.split()
-                # Assumes label is always the first argument and path the second after 'rclone mount'
-                idx = [i for i, s in enumerate(parts) if "mount" in s][0]
-                if len(parts) > idx + 2:
-                    label = parts[parts.index("mount") + 1]
-                    path = parts[parts.index("mount") + 2]
-                    mountpoints[label] = path
+        for line in output.splitlines():
+            self._add_rclone_argv(line.split(), mountpoints)
 
         return mountpoints
@@ -1,9 +1,12 @@
 import os
-
+import platform
 import tempfile
 import stat
 
 from ..finder.devices import DeviceFinder
+from ..utils import read_mountinfo
+
+_SYSTEM = platform.system()
 
 
 class MountBase:
@@ -18,15 +21,13 @@ class MountBase:
 
     def get_dirname(self):
         """
-        Creates a temporary directory to extract its path and then removes it,
-        effectively fetching a directory name for potential use.
+        Fetches the directory where the temporary directories are created, the same one
+        `tempfile.mkdtemp` uses, without creating anything.
 
         Returns:
             str: The path of the directory intended for temporary use.
         """
-        temp_dir = self.generate_temporary_directory(symbolic=True)
-        path = os.path.dirname(temp_dir)
-        return path
+        return tempfile.gettempdir()
 
     def generate_temporary_directory(self, symbolic=False):
         """
@@ -63,12 +64,35 @@ class MountBase:
         """
         if device is None and path is None:
             raise ValueError("A device dictionary or a path must be provided.")
+        candidates = []
         if device:
-            for mountpoint in device.get("mountpoints", []):
-                if self.prefix in mountpoint and os.path.exists(mountpoint):
-                    os.rmdir(mountpoint)
-        if path and self.prefix in path and os.path.exists(path):
-            os.rmdir(path)
+            candidates.extend(device.get("mountpoints", []))
+        if path:
+            candidates.append(path)
+
+        for candidate in candidates:
+            if self.prefix in candidate:
+                try:
+                    os.rmdir(candidate)
+                except OSError:
+                    # Already removed, still mounted or not empty: leave it for clean()
+                    pass
+
+    def is_mounted(self, path):
+        """
+        Checks whether something is mounted at the given path. On Linux the kernel mount
+        table is read directly, elsewhere the path is compared with its parent directory.
+
+        Args:
+            path (str): The path to check.
+
+        Returns:
+            bool: True if the path is a mount point.
+        """
+        if _SYSTEM == "Linux":
+            mountpoints = {mount["dst"] for mount in read_mountinfo()}
+            return path in mountpoints or os.path.realpath(path) in mountpoints
+        return os.path.ismount(path)
 
     def get_device(self, label=None, device_name=None, path=None):
         """
@@ -9,6 +9,10 @@ class MountDrive(MountBase):
     the appropriate mounting strategy based on the drive's file system type.
     """
 
+    def __init__(self):
+        super().__init__()
+        self._mounters = {}
+
     def mount(self, label=None, device_name=None):
         """
         Mounts a device identified by its label or name. Automatically selects
@@ -26,12 +30,13 @@ class MountDrive(MountBase):
         if device is None:
             raise Exception("Device not found.")
 
-        if device["fstype"] == "fuse.rclone":
-            mounter = MountDriveRclone()
-        else:
-            mounter = MountDrivePhysical()
+        mounter = self._get_mounter(device["fstype"])
 
-        return mounter.mount(device=device)
+        mounted = mounter.mount(device=device)
+        if mounted:
+            # The cached device list no longer reflects the mount points
+            self.finder.invalidate()
+        return mounted
 
     #    def unmount(self, label=None, device_name=None, path=None):
     #         if path is not None:
@@ -44,7 +49,7 @@ class MountDrive(MountBase):
     #             mount = MountDrivePhysical()
     #         mount.unmount(name=device_name, device=device, path=path)
 
-    def unmount(self, label=None, device_name=None, path=None):
+    def unmount(self, label=None, device_name=None, path=None, device=None):
         """
         Unmounts a device identified by its label, name, or mount path. Automatically selects
         the correct unmounting strategy (rclone or physical) based on the file system type.
@@ -53,26 +58,46 @@ class MountDrive(MountBase):
             label (str, optional): The label of the device to unmount.
             device_name (str, optional): The name of the device to unmount.
             path (str, optional): The mount path of the device to unmount.
+            device (dict, optional): The device, when already resolved by the caller,
+                so it is not looked up again.
 
         Raises:
             Exception: If the device cannot be found (when path is not provided) or an unsupported file system type is encountered.
         """
 
-        device = self.get_device(label=label, device_name=device_name, path=path)
+        if device is None:
+            device = self.get_device(label=label, device_name=device_name, path=path)
 
         if len(device) < 1:
             raise Exception("Device not found.")
 
-        if device["fstype"] == "fuse.rclone":
-            mounter = MountDriveRclone()
-        else:
-            mounter = MountDrivePhysical()
+        mounter = self._get_mounter(device["fstype"])
 
         mounter.unmount(device=device, path=path)
+        self.finder.invalidate()
+
+    def _get_mounter(self, fstype):
+        """
+        Retrieves the mounter for a file system type (rclone or physical). Each one is
+        created on first use, shares this instance's device finder and is reused afterwards.
+
+        Args:
+            fstype (str): The file system type of the device.
+
+        Returns:
+            MountDriveRclone or MountDrivePhysical: The mounter for the device.
+        """
+        kind = "rclone" if fstype == "fuse.rclone" else "physical"
+        if kind not in self._mounters:
+            mounter = MountDriveRclone() if kind == "rclone" else MountDrivePhysical()
+            mounter.finder = self.finder
+            self._mounters[kind] = mounter
+        return self._mounters[kind]
 
     def get_mountpoint(self, label=None, device_name=None):
         """
         Retrieves the mount points for a device identified by its label or name.
+        Served from the finder's cached device list unless a mount changed it.
 
         Args:
             label (str, optional): The label of the device.
@@ -2,9 +2,11 @@ import platform
 import os
 
 from .base import MountBase
-from ..utils import execute_command, setup_environment
+from ..utils import execute_command, execute_command_argv
 from ..bare.gocryptfs import Gocryptfs
 
+_SYSTEM = platform.system()
+
 
 class MountGocryptfs(MountBase):
     """
@@ -22,7 +24,7 @@ class MountGocryptfs(MountBase):
 
     def mount(self, label, device=None):
         source = label
-        device = self.finder.find_device(source)
+        device = self.finder.find_device(source, want="gocryptfs")
 
         if len(device) > 0:
             print(f"Device is already mounted at: {device['mountpoints']}")
@@ -30,8 +32,9 @@ class MountGocryptfs(MountBase):
         else:
             try:
                 # Check if a folder is a gocryptfs repo, if not it will raise an error
-                cmd = "gocryptfs -info {}"
-                out = execute_command(cmd.format(source), env=self.env)
+                execute_command_argv(
+                    ["gocryptfs", "-info", source], env_vars=self.gofs.env
+                )
                 # Generate a temporary folder to mount the gocryptfs
                 dest = self.generate_temporary_directory()
                 assert os.path.exists(
@@ -65,7 +68,7 @@ class MountGocryptfs(MountBase):
 
         # Determine the unmount path
         if path is None:
-            device = device or self.finder.find_device(label=label)
+            device = device or self.finder.find_device(label=label, want="gocryptfs")
             if device["mountpoints"]:
                 unmount_path = device["mountpoints"][0]
             else:
@@ -75,9 +78,8 @@ class MountGocryptfs(MountBase):
             unmount_path = path
 
         # Check OS compatibility
-        os_type = platform.system()
-        if os_type in ["Linux", "Darwin"]:
-            execute_command(f"umount {unmount_path}")
+        if _SYSTEM in ["Linux", "Darwin"]:
+            execute_command(["umount", unmount_path])
             self.clean_device_temporary_directory(device=device, path=unmount_path)
         else:
             raise NotImplementedError(
@@ -3,6 +3,8 @@ import platform
 from .base import MountBase
 from ..utils import execute_command
 
+_SYSTEM = platform.system()
+
 
 class MountDriveLinux(MountBase):
     """
@@ -21,7 +23,7 @@ class MountDriveLinux(MountBase):
             Exception: If the `execute_command` function encounters an error.
         """
         try:
-            command = f"udisksctl mount -b /dev/{device_name}"
+            command = ["udisksctl", "mount", "-b", f"/dev/{device_name}"]
             execute_command(command)
         except Exception as e:
             raise Exception(f"Failed to mount /dev/{device_name}: {e}")
@@ -37,10 +39,10 @@ class MountDriveLinux(MountBase):
             Exception: If the device is busy or if any other error occurs during the unmount operation.
         """
         try:
-            command = f"udisksctl unmount -p {path}"
+            command = ["udisksctl", "unmount", "-p", path]
             execute_command(command)
         except Exception as e:
-            msg = e.stderr.decode("utf-8").rstrip()
+            msg = str(e).rstrip()
             if "busy" in msg:
                 print(f"The device at {path} is being used and cannot be unmounted:")
                 print(msg)
@@ -67,8 +69,8 @@ class MountDriveDarwin(MountBase):
         """
         try:
             path = self.generate_temporary_directory()
-            cmd = f"diskutil mount -mountPoint {path} /dev/{device_name}"
-            execute_command(cmd)
+            command = ["diskutil", "mount", "-mountPoint", path, f"/dev/{device_name}"]
+            execute_command(command)
         except Exception as e:
             raise Exception(f"Failed to mount /dev/{device_name}: {e}")
 
@@ -83,8 +85,7 @@ class MountDriveDarwin(MountBase):
             Exception: If an error occurs during the execution of the unmount command.
         """
         try:
-            cmd = f"diskutil unmount {path}"
-            execute_command(cmd)
+            execute_command(["diskutil", "unmount", path])
         except Exception as e:
             raise Exception(f"Failed to unmount {path}: {e}")
 
@@ -113,6 +114,10 @@ class MountDrivePhysical(MountBase):
     on the runtime OS.
     """
 
+    def __init__(self):
+        super().__init__()
+        self._mounter = None
+
     def mount(self, name=None, device=None):
         """
         Mounts a physical drive identified by its name or device dictionary. Automatically
@@ -129,7 +134,7 @@ class MountDrivePhysical(MountBase):
         if device is None and name is None:
             raise Exception("You should pass the device dict or the drive name")
 
-        device = device or self.finder.find_device(name=name)
+        device = device or self.finder.find_device(name=name, want="physical")
 
         if not device["mountpoints"]:
             mounter = self._get_mounter()
@@ -159,10 +164,13 @@ class MountDrivePhysical(MountBase):
             )
 
         if path is None:
-            device = device or self.finder.find_device(name=name)
+            device = device or self.finder.find_device(name=name, want="physical")
             path = device["mountpoints"][0] if device["mountpoints"] else None
 
-        if path:
+        if path and not self.is_mounted(path):
+            print(f"Nothing is mounted at {path} anymore.")
+            self.clean_device_temporary_directory(device=device, path=path)
+        elif path:
             mounter = self._get_mounter()
             mounter.unmount(path)
             self.clean_device_temporary_directory(device=device, path=path)
@@ -172,6 +180,7 @@ class MountDrivePhysical(MountBase):
     def _get_mounter(self):
         """
         Determines the appropriate mounter subclass based on the current operating system.
+        The instance is created on first use and reused afterwards.
 
         Returns:
             An instance of the appropriate mounter subclass.
@@ -179,14 +188,17 @@ class MountDrivePhysical(MountBase):
         Raises:
             NotImplementedError: If the mounting or unmounting functionality is not implemented for the OS.
         """
-        os_type = platform.system()
-        if os_type == "Linux":
-            return MountDriveLinux()
-        elif os_type == "Darwin":
-            return MountDriveDarwin()
-        elif os_type == "Windows":
+        if self._mounter is not None:
+            return self._mounter
+        if _SYSTEM == "Linux":
+            self._mounter = MountDriveLinux()
+            return self._mounter
+        elif _SYSTEM == "Darwin":
+            self._mounter = MountDriveDarwin()
+            return self._mounter
+        elif _SYSTEM == "Windows":
             # Placeholder for future implementation
             # return MountDriveWin()
             raise NotImplementedError("Mounting in Windows is not implemented yet")
         else:
-            raise NotImplementedError(f"Mounting in {os_type} is not implemented yet")
+            raise NotImplementedError(f"Mounting in {_SYSTEM} is not implemented yet")
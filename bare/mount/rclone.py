@@ -4,6 +4,8 @@ import os
 from .base import MountBase
 from ..utils import execute_command
 
+_SYSTEM = platform.system()
+
 
 class MountDriveRclone(MountBase):
     """
@@ -26,7 +28,7 @@ class MountDriveRclone(MountBase):
         if device is None and label is None:
             raise Exception("You should pass the device dict or the label")
 
-        device = device or self.finder.find_device(label=label)
+        device = device or self.finder.find_device(label=label, want="rclone")
 
         if not device["mountpoints"]:
             path = self.generate_temporary_directory()
@@ -34,7 +36,7 @@ class MountDriveRclone(MountBase):
                 path
             ), "Failed to create a temporary folder for rclone mount"
 
-            execute_command(f"rclone mount {device['label']} {path} --daemon")
+            execute_command(["rclone", "mount", device["label"], path, "--daemon"])
             return True
         else:
             print(f"Device is already mounted at: {device['mountpoints']}")
@@ -60,7 +62,7 @@ class MountDriveRclone(MountBase):
 
         # Determine the unmount path
         if path is None:
-            device = device or self.finder.find_device(label=label)
+            device = device or self.finder.find_device(label=label, want="rclone")
             if device["mountpoints"]:
                 unmount_path = device["mountpoints"][0]
             else:
@@ -70,9 +72,11 @@ class MountDriveRclone(MountBase):
             unmount_path = path
 
         # Check OS compatibility
-        os_type = platform.system()
-        if os_type in ["Linux", "Darwin"]:
-            execute_command(f"umount {unmount_path}")
+        if _SYSTEM in ["Linux", "Darwin"]:
+            if not self.is_mounted(unmount_path):
+                print(f"Nothing is mounted at {unmount_path} anymore.")
+            else:
+                execute_command(["umount", unmount_path])
             self.clean_device_temporary_directory(device=device, path=unmount_path)
         else:
             raise NotImplementedError(
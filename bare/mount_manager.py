@@ -1,55 +1,102 @@
 import platform
 import os
+import asyncio
+import time
+from concurrent.futures import ThreadPoolExecutor
 
 from .finder.devices import DeviceFinder
 from .mount.base import MountBase
 from .mount.drive import MountDrive
-from .utils import execute_command
+from .utils import execute_command, parse_mount, read_mountinfo
+
+_SYSTEM = platform.system()
 
 
 class MountPointFinder:
+    # Seconds a mount table snapshot is reused before being read again
+    SNAPSHOT_TTL = 1.0
+
+    def __init__(self):
+        self._snapshot = None
+        self._snapshot_time = 0.0
+
+    def _read_table(self):
+        """
+        Reads the mount table, mapping every mount point to the device mounted on it.
+
+        Returns:
+            dict: Mount point paths as keys and device names (without '/dev/') as values.
+        """
+        if _SYSTEM == "Linux":
+            mounts = read_mountinfo()
+        elif _SYSTEM == "Darwin":
+            mounts = parse_mount()
+        else:
+            raise NotImplementedError(f"OS {_SYSTEM} not supported.")
+        # Later entries are mounted on top of earlier ones, so they win
+        return {mount["dst"]: self._device_name(mount["src"]) for mount in mounts}
+
+    def snapshot(self):
+        """
+        Maps every mount point to the device mounted on it, reading the mount table once
+        for all lookups. The result is reused for `SNAPSHOT_TTL` seconds.
+
+        Returns:
+            dict: Mount point paths as keys and device names (without '/dev/') as values.
+        """
+        now = time.monotonic()
+        if self._snapshot is None or now - self._snapshot_time > self.SNAPSHOT_TTL:
+            self._snapshot = self._read_table()
+            self._snapshot_time = now
+        return self._snapshot
+
+    @staticmethod
+    def lookup(table, mount_point):
+        """
+        Finds the device of a mount point in a table from `snapshot`. The path must match
+        exactly, either as given or resolved, since the table may list the resolved path
+        (e.g. /private/var on macOS).
+
+        Returns:
+            str or None: The device name, None if nothing is mounted there.
+        """
+        device = table.get(mount_point)
+        if device is None:
+            device = table.get(os.path.realpath(mount_point))
+        return device
+
+    @staticmethod
+    def _device_name(source):
+        """Strips the '/dev/' prefix of a mount source, keeping other sources as they are."""
+        return source[len("/dev/") :] if source.startswith("/dev/") else source
+
     def find_device(self, mount_point):
         """Determine the method to use based on the operating system."""
-        os_type = platform.system()
-        if os_type == "Linux" or os_type == "Unix":
+        if _SYSTEM in ["Linux", "Darwin"]:
             return self._find_device_unix(mount_point)
-        elif os_type == "Darwin":
-            return self._find_device_darwin(mount_point)
-        elif os_type == "Windows":
+        elif _SYSTEM == "Windows":
             return self._find_device_windows(mount_point)
         else:
-            raise NotImplementedError(f"OS {os_type} not supported.")
+            raise NotImplementedError(f"OS {_SYSTEM} not supported.")
 
     def _find_device_unix(self, mount_point):
-        """Find the device mounted at `mount_point` for Unix/Linux."""
-        with open("/proc/mounts", "r") as mounts:
-            for line in mounts:
-                parts = line.split()
-                if parts[1] == mount_point:
-                    # return parts[0], parts[2]
-                    return parts[0].split("/dev/")[1]
-        return None
-
-    def _find_device_darwin(self, mount_point):
-        """Find the device mounted at `mount_point` on macOS."""
-        # TODO
-        out = execute_command("mount")
-
-        for line in out.splitlines():
-            if mount_point in line:
-                parts = line.split()
-                # The device is typically the first part
-                return parts[0].split("/dev/")[1]
-        return None
+        """Find the device mounted at `mount_point` on Linux and macOS."""
+        # Always read afresh, a snapshot may predate a mount that just happened
+        return self.lookup(self._read_table(), mount_point)
 
     def _find_device_windows(self, mount_point):
         """Find the volume of the drive with the given letter on Windows."""
         # Adjust `mount_point` to match the expected input format for Windows (e.g., "C:")
         if not mount_point.endswith(":"):
             mount_point += ":"
-        command = (
-            f'wmic logicaldisk where DeviceID="{mount_point}" get VolumeName, DeviceID'
-        )
+        command = [
+            "wmic",
+            "logicaldisk",
+            "where",
+            f"DeviceID='{mount_point}'",
+            "get",
+            "VolumeName,DeviceID",
+        ]
         out = execute_command(command)
         # Parse the output to extract the device information
         if out:
@@ -69,8 +116,22 @@ class MountManager:
         self.finder = DeviceFinder()
         self.mount_base = MountBase()
         self.mounter = MountDrive()
+        # A single device cache for the manager and its mounter
+        self.mounter.finder = self.finder
         self.mount_finder = MountPointFinder()
 
+    def _scan_managed(self):
+        """
+        Lists the entries created by the mount operations in a single directory read.
+        The entries keep the file types returned with the listing, so checking them
+        needs no further stat calls.
+
+        Returns:
+            list of os.DirEntry: The managed folders and symbolic links.
+        """
+        with os.scandir(self.mount_base.get_dirname()) as entries:
+            return [e for e in entries if self.mount_base.prefix in e.name]
+
     def get_mounted_devices(self):
         """
         Retrieves a dictionary of currently mounted devices and their mount points.
@@ -78,43 +139,99 @@ class MountManager:
         Returns:
             dict: A dictionary with device identifiers as keys and mount paths as values.
         """
-        dirname = self.mount_base.get_dirname()
-        ls = os.listdir(dirname)
-        my_files = [x for x in ls if self.mount_base.prefix in x]
+        # Symbolic links are never mount points themselves
+        paths = [e.path for e in self._scan_managed() if not e.is_symlink()]
 
         devices = {}
-        for file in my_files:
-            path = os.path.join(dirname, file)
-            if os.path.ismount(path):
-                device = self.mount_finder.find_device(path)
+        mounted = self.mount_finder.snapshot() if paths else {}
+        for path in paths:
+            # Looked up in the mount table instead of stat-ing the path and its parent
+            device = self.mount_finder.lookup(mounted, path)
+            if device is not None:
                 devices[device] = path
 
         return devices
 
-    def umount_all(self):
+    def _resolve_mounted(self):
         """
-        Unmounts all mounted devices that were mounted through this manager.
-        Raises an exception if a device cannot be found.
+        Lists the mount paths created by this manager and resolves their devices from a
+        single device scan instead of one scan per unmount.
+
+        Returns:
+            tuple: The list of mount paths and a dictionary mapping mountpoints to devices.
         """
-        mounted_devices = self.get_mounted_devices()
-        all_devices = self.finder.find_device()
+        paths = list(self.get_mounted_devices().values())
 
-        for _, path in mounted_devices.items():
-            self.mounter.unmount(path=path)
+        by_mount = {}
+        if paths:
+            for device in self.finder.get_all_devices():
+                for mountpoint in device["mountpoints"]:
+                    by_mount.setdefault(mountpoint, device)
+        return paths, by_mount
+
+    def umount_all(self):
+        """
+        Unmounts all mounted devices that were mounted through this manager concurrently,
+        so the total time is that of the slowest unmount rather than the sum of all of them.
+        Every unmount is attempted even if another one fails; the failures are reported and
+        the first one is raised at the end.
+        """
+        paths, by_mount = self._resolve_mounted()
+
+        # Only resolved devices are unmounted, so no thread looks up the shared cache
+        found = [path for path in paths if path in by_mount]
+        outcomes = {}
+        if found:
+            with ThreadPoolExecutor(max_workers=len(found)) as executor:
+                futures = {
+                    path: executor.submit(
+                        self.mounter.unmount, path=path, device=by_mount[path]
+                    )
+                    for path in found
+                }
+            outcomes = {path: future.exception() for path, future in futures.items()}
+        self.finder.invalidate()
+
+        errors = []
+        for path in paths:
+            error = outcomes.get(
+                path, ValueError(f"Could not find the device mounted at {path}.")
+            )
+            if error is not None:
+                print(f"Failed to unmount {path}: {error}")
+                errors.append(error)
+        if errors:
+            raise errors[0]
+
+    async def umount_all_async(self):
+        """
+        Coroutine version of `umount_all`, run in the loop's default executor so the
+        event loop is not blocked.
+        """
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(None, self.umount_all)
 
     def clean(self):
         """
         Cleans up all temporary directories and broken symbolic links created by the mount operations.
         """
-        dirname = self.mount_base.get_dirname()
-        my_files = self.get_folders_created()
-
-        for file in my_files:
-            path = os.path.join(dirname, file)
-            if os.path.islink(path):
-                self.clean_broken_symbolic_link(path)
-            elif not os.path.ismount(path) and not os.listdir(path):
-                os.rmdir(path)
+        managed = self._scan_managed()
+        mounted = self.mount_finder.snapshot() if managed else {}
+
+        # The entry types come with the directory listing, no extra stat is needed
+        for entry in managed:
+            if entry.is_symlink():
+                self.clean_broken_symbolic_link(entry.path)
+            elif (
+                entry.is_dir(follow_symlinks=False)
+                and self.mount_finder.lookup(mounted, entry.path) is None
+                and not os.listdir(entry.path)
+            ):
+                try:
+                    os.rmdir(entry.path)
+                except OSError:
+                    # Mounted since the mount table was read
+                    pass
 
     def get_folders_created(self):
         """
@@ -123,9 +240,7 @@ class MountManager:
         Returns:
             list: A list of folder names.
         """
-        dirname = self.mount_base.get_dirname()
-        ls = os.listdir(dirname)
-        return [x for x in ls if self.mount_base.prefix in x]
+        return [entry.name for entry in self._scan_managed()]
 
     def clean_broken_symbolic_link(self, path):
         """
@@ -1,9 +1,33 @@
 import os
+import functools
 import platform
-import subprocess
+import shlex
 import re
+import struct
+import hashlib
+import asyncio
+import codecs
+import locale
+import subprocess
+import tempfile
 import threading
 
+_SYSTEM = platform.system()
+
+# Lines of the 'mount' command output. Paths may contain spaces, so only the
+# filesystem type is matched as a single word.
+# Linux: /dev/sda1 on / type ext4 (rw,relatime,errors=remount-ro)
+_LINUX_MOUNT_RE = re.compile(r"(.+?) on (.+?) type (\S+) \((.*)\)\Z")
+# macOS: /dev/disk1s1 on / (apfs, local, read-only, journaled)
+_DARWIN_MOUNT_RE = re.compile(r"(.+?) on (.+?) \(([^,()]+)(?:, (.*))?\)\Z")
+
+# Text encoding used for command output, the same default subprocess uses
+_ENCODING = locale.getpreferredencoding(False)
+# Bytes read at a time from a command's output
+_CHUNK_SIZE = 64 * 1024
+# Serializes the echoed output of commands running at the same time
+_PRINT_LOCK = threading.Lock()
+
 
 def setup_environment(env_vars=None):
     """
@@ -13,96 +37,291 @@ def setup_environment(env_vars=None):
     env_vars (dict, optional): Dictionary of environment variables and their values.
 
     Returns:
-    dict: A dictionary representing the environment.
+    dict or None: A dictionary representing the environment, or None when there is
+    nothing to add so the process simply inherits the current environment.
     """
-    environment = dict(os.environ.copy())
-    if env_vars:
-        environment.update(env_vars)
+    if not env_vars:
+        return None
+    environment = os.environ.copy()
+    environment.update(env_vars)
     return environment
 
 
+def expand_path(value):
+    """
+    Expand a leading '~' and '$VAR'/'${VAR}' references the way the shell did when
+    commands were still run through it. Unknown variables are left untouched.
+
+    Args:
+    value (str): The path or option value to expand.
+
+    Returns:
+    str: The expanded value.
+    """
+    return os.path.expandvars(os.path.expanduser(value))
+
+
 def modify_command_for_os(command, mask=None):
     """
     Modify the command based on the operating system, such as using proot on Linux.
 
     Args:
-    command (str): The initial command.
+    command (str or list): The initial command, as a string or an argument list.
     mask (str, optional): Path to be masked using proot on Linux.
 
     Returns:
-    str: The potentially modified command.
+    str or list: The potentially modified command, of the same type as `command`.
     """
-    os_type = platform.system()
-    if os_type == "Linux" and mask:
+    if _SYSTEM == "Linux" and mask:
         # mask = ["True path", "masked path"]
+        if isinstance(command, list):
+            bind = f"{expand_path(mask[0])}:{expand_path(mask[1])}"
+            return ["proot", "-b", bind] + command
         return f"proot -b {mask[0]}:{mask[1]} {command}"
     return command
 
 
-def stream_reader(pipe, output_list):
-    """Read from the pipe line by line and store the output in the provided list."""
-    for line in iter(pipe.readline, ""):
-        print(line, end="", flush=True)
-        output_list.append(line)
-    pipe.close()
+def stream_reader(pipe, output_list, encoding=None):
+    """
+    Read from the pipe chunk by chunk, echoing the text and storing it in the
+    provided list. When the list is None the text is only echoed, keeping memory
+    bounded. Only whole lines (ended by '\\n' or '\\r', as progress bars do) are
+    echoed, under a lock shared by all readers, so commands running concurrently
+    do not mix their lines on the terminal.
+    """
+    decoder = codecs.getincrementaldecoder(encoding or _ENCODING)(errors="replace")
+    pending = ""
+    with pipe:
+        while True:
+            chunk = pipe.read1(_CHUNK_SIZE)
+            text = decoder.decode(chunk, final=not chunk)
+            if text and output_list is not None:
+                output_list.append(text)
+            pending += text
+            if not chunk or len(pending) > _CHUNK_SIZE:
+                cut = len(pending)
+            else:
+                cut = max(pending.rfind("\n"), pending.rfind("\r")) + 1
+            if cut:
+                with _PRINT_LOCK:
+                    print(pending[:cut], end="", flush=True)
+                pending = pending[cut:]
+            if not chunk:
+                break
+
+
+def _run_process(command, environment, shell, ignore_error, capture=True, stream=False):
+    """
+    Run a process and return its output, optionally streaming it live.
+
+    Args:
+        command (str or list): Shell string when `shell` is True, argument list otherwise.
+        environment (dict or None): Environment for the process, None to inherit it.
+        shell (bool): Whether the command goes through the shell.
+        ignore_error (bool): If True, a non-zero exit code does not raise.
+        capture (bool): If False, the standard output is not kept.
+        stream (bool): If True, the output is echoed while the process runs. Otherwise it
+            is collected in one go once the process exits.
+
+    Returns:
+        str: The standard output from the command execution, empty if not captured.
+    """
+    with subprocess.Popen(
+        command,
+        shell=shell,
+        env=environment,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+    ) as process:
+        if stream:
+            stdout_output = [] if capture else None
+            stderr_output = []
+            # Create threads to read stdout and stderr to avoid blocking
+            threads = [
+                threading.Thread(
+                    target=stream_reader, args=(process.stdout, stdout_output)
+                ),
+                threading.Thread(
+                    target=stream_reader, args=(process.stderr, stderr_output)
+                ),
+            ]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+            process.wait()
+            stdout = "".join(stdout_output) if capture else ""
+            stderr = "".join(stderr_output)
+        else:
+            stdout_data, stderr_data = process.communicate()
+            stdout = stdout_data.decode(_ENCODING, errors="replace") if capture else ""
+            stderr = stderr_data.decode(_ENCODING, errors="replace")
+
+    # Check the process exit code to determine if the command was successful
+    if process.returncode != 0 and not ignore_error:
+        raise Exception(f"Command failed with error: {stderr}")
+
+    return stdout
+
+
+async def execute_command_async(
+    command, env_vars=None, mask=None, ignore_error=False, capture=True, stream=False
+):
+    """
+    Coroutine version of `execute_command`, so several commands can be awaited
+    together (e.g. with asyncio.gather) instead of running one after another.
+    The command runs in the loop's default executor.
+
+    Args:
+        command (str or list): The command that will be executed. A string runs through
+            the shell, an argument list is executed directly without one.
+        env_vars (dict, optional): Dictionary of environment variables and their values.
+        mask (str, optional): Path to be masked using proot on Linux.
+        ignore_error (bool): If True, a non-zero exit code does not raise.
+        capture (bool): If False, the output is not kept.
+        stream (bool): If True, the output is echoed live while the command runs, for
+            long-running commands with progress the user should see.
 
+    Returns:
+        str: The standard output from the command execution, empty if not captured.
 
-def execute_command(command, env_vars=None, mask=None, ignore_error=False):
+    Raises:
+        Exception: If the command execution fails, an exception is raised with the error message.
+    """
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(
+        None,
+        functools.partial(
+            execute_command, command, env_vars, mask, ignore_error, capture, stream
+        ),
+    )
+
+
+def execute_command(
+    command, env_vars=None, mask=None, ignore_error=False, capture=True, stream=False
+):
     """
     Execute a terminal command with optional environment variables and path masking,
     and return the output.
 
     Args:
-        command (str): The command that will be executed.
+        command (str or list): The command that will be executed. A string runs through
+            the shell, an argument list is executed directly without one.
         env_vars (dict, optional): Dictionary of environment variables and their values.
         mask (str, optional): Path to be masked using proot on Linux.
+        ignore_error (bool): If True, a non-zero exit code does not raise.
+        capture (bool): If False, the output is not kept, for long-running commands
+            with verbose progress.
+        stream (bool): If True, the output is echoed live while the command runs, for
+            long-running commands with progress the user should see.
 
     Returns:
-        str: The standard output from the command execution.
+        str: The standard output from the command execution, empty if not captured.
 
     Raises:
         Exception: If the command execution fails, an exception is raised with the error message.
     """
     environment = setup_environment(env_vars)
-    command = modify_command_for_os(command, mask)
+    shell = isinstance(command, str)
+    command = modify_command_for_os(command if shell else list(command), mask)
+    return _run_process(command, environment, shell, ignore_error, capture, stream)
 
-    # Initialize lists to capture standard output and error streams
-    stdout_output = []
-    stderr_output = []
 
-    # Use subprocess to execute the command, capturing stdout and stderr
-    with subprocess.Popen(
-        command,
-        stdout=subprocess.PIPE,
-        stderr=subprocess.PIPE,
-        shell=True,
-        env=environment,
-        universal_newlines=True,
-    ) as process:
+def execute_command_lines(command, env_vars=None, mask=None, ignore_error=False):
+    """
+    Execute a terminal command and yield its output line by line as it is produced,
+    so callers parsing the output never hold all of it in memory at once.
 
-        # Create threads to read stdout and stderr to avoid blocking
-        stdout_thread = threading.Thread(
-            target=stream_reader, args=(process.stdout, stdout_output)
-        )
-        stderr_thread = threading.Thread(
-            target=stream_reader, args=(process.stderr, stderr_output)
+    Args:
+        command (str or list): The command that will be executed. A string runs through
+            the shell, an argument list is executed directly without one.
+        env_vars (dict, optional): Dictionary of environment variables and their values.
+        mask (str, optional): Path to be masked using proot on Linux.
+        ignore_error (bool): If True, a non-zero exit code does not raise.
+
+    Yields:
+        str: Each line of the standard output, without the line ending.
+
+    Raises:
+        Exception: If the command execution fails, an exception is raised with the error message
+            once all the output has been read.
+    """
+    environment = setup_environment(env_vars)
+    shell = isinstance(command, str)
+    command = modify_command_for_os(command if shell else list(command), mask)
+
+    # The error output goes to a file, a pipe could fill up while stdout is being read
+    with tempfile.TemporaryFile() as stderr_file:
+        process = subprocess.Popen(
+            command,
+            shell=shell,
+            env=environment,
+            stdout=subprocess.PIPE,
+            stderr=stderr_file,
         )
+        try:
+            for line in process.stdout:
+                yield line.decode(_ENCODING, errors="replace").rstrip("\r\n")
+            process.wait()
+        finally:
+            # The caller may stop early, the process must not be left behind
+            process.stdout.close()
+            if process.poll() is None:
+                process.kill()
+                process.wait()
+
+        if process.returncode != 0 and not ignore_error:
+            stderr_file.seek(0)
+            stderr = stderr_file.read().decode(_ENCODING, errors="replace")
+            raise Exception(f"Command failed with error: {stderr}")
+
+
+def execute_command_argv(
+    argv, env_vars=None, ignore_error=False, capture=True, stream=False
+):
+    """
+    Execute a command given as an argument list, without going through a shell,
+    and return the output. Same as passing a list to `execute_command`.
 
-        stdout_thread.start()
-        stderr_thread.start()
+    Args:
+        argv (list): The program and its arguments.
+        env_vars (dict, optional): Dictionary of environment variables and their values.
+        ignore_error (bool): If True, a non-zero exit code does not raise.
+        capture (bool): If False, the output is not kept, for long-running commands
+            with verbose progress.
+        stream (bool): If True, the output is echoed live while the command runs, for
+            long-running commands with progress the user should see.
 
-        # Wait for the threads to finish reading the output streams
-        stdout_thread.join()
-        stderr_thread.join()
+    Returns:
+        str: The standard output from the command execution, empty if not captured.
 
-        # Wait for the process to complete execution
-        process.wait()
+    Raises:
+        Exception: If the command execution fails, an exception is raised with the error message.
+    """
+    return execute_command(list(argv), env_vars, None, ignore_error, capture, stream)
 
-    # Check the process exit code to determine if the command was successful
-    if process.returncode != 0 and not ignore_error:
-        raise Exception(f"Command failed with error: {''.join(stderr_output)}")
 
-    return "".join(stdout_output)
+def execute_command_proot(
+    argv, env_vars=None, mask=None, ignore_error=False, capture=True, stream=False
+):
+    """
+    Execute a command given as an argument list with its paths masked, which
+    wraps it with proot on Linux. Commands without a mask should call
+    `execute_command_argv` directly.
+
+    Args:
+        argv (list): The program and its arguments.
+        env_vars (dict, optional): Dictionary of environment variables and their values.
+        mask (str, optional): Path to be masked using proot on Linux.
+        ignore_error (bool): If True, a non-zero exit code does not raise.
+        capture (bool): If False, the output is not kept.
+        stream (bool): If True, the output is echoed live while the command runs.
+
+    Returns:
+        str: The standard output from the command execution, empty if not captured.
+    """
+    argv = modify_command_for_os(list(argv), mask)
+    return execute_command_argv(argv, env_vars, ignore_error, capture, stream)
 
 
 def execute_command_test(command, env_vars=None, mask=None):
@@ -111,18 +330,20 @@ def execute_command_test(command, env_vars=None, mask=None):
     and return the output.
 
     Args:
-    command (str): The command that will be executed.
+    command (str or list): The command that will be executed.
     env_vars (dict, optional): Dictionary of environment variables and their values.
     mask (str, optional): Path to be masked using proot on Linux.
 
     Returns:
-    str: The standard output from the command execution.
+    str: The command that would have been executed.
 
     Raises:
     Exception: If the command execution fails, an exception is raised with the error message.
     """
     environment = setup_environment(env_vars)
     command = modify_command_for_os(command, mask)
+    if isinstance(command, list):
+        command = join_argv(command)
 
     print(f"I was supposed to run: {command}")
     return command
@@ -130,34 +351,45 @@ def execute_command_test(command, env_vars=None, mask=None):
 
 def build_command(command, *args):
     """
-    Build a shell command by concatenating a base command with additional arguments,
-    ensuring proper spacing between each component.
+    Build a command argument list from a base command and additional arguments.
 
     Args:
-    command (str): The base command to be executed.
+    command (str or list): The base command, a single executable or an argument list.
     *args: A variable number of additional arguments that will be appended to the command.
 
     Returns:
-    str: The fully constructed command string.
+    list: The fully constructed argument list.
+    """
+    if isinstance(command, str):
+        command = [command]
+    elif not isinstance(command, list):
+        raise ValueError("The command must be a string or a list.")
+
+    # Every argument is kept whole, so values with spaces need no quoting
+    return command + [str(arg) for arg in args]
+
+
+def join_argv(argv):
     """
-    # Ensure that the base command is a string
-    if not isinstance(command, str):
-        raise ValueError("The command must be a string.")
+    Join an argument list into a shell-quoted string, for display purposes.
 
-    # Convert all additional arguments to strings and create the full command
-    args_str = " ".join(str(arg) for arg in args)
-    full_command = f"{command} {args_str}".strip()
+    Args:
+    argv (list): The program and its arguments.
 
-    return full_command
+    Returns:
+    str: The quoted command line.
+    """
+    return " ".join(shlex.quote(str(arg)) for arg in argv)
 
 
+@functools.lru_cache(maxsize=1)
 def get_hostname():
     """Retrieve the current machine's hostname.
 
     Returns:
         str: The hostname of the machine.
     """
-    if platform.system() == "Darwin":
+    if _SYSTEM == "Darwin":
         hostname_full = platform.node()
         hostname = hostname_full.split(".local")[0]
     else:
@@ -166,28 +398,110 @@ def get_hostname():
 
 
 def dict2args(args, double="--", single="-", join_double=" ", join_single=" "):
-    def gen_arg(arg, val):
-        # Determine the prefix for the argument name.
-        arg_name = double + arg if len(arg) > 1 else single + arg
+    out = []
+    for k, v in args.items():
+        # The prefix and join character only depend on the argument name.
+        if len(k) > 1:
+            head = double + k + join_double
+        else:
+            head = single + k + join_single
 
-        # Determine the character to join the argument name and value.
-        join = join_double if len(arg) > 1 else join_single
+        # Lists repeat the argument once per item.
+        out.extend(head + str(item) for item in (v if isinstance(v, list) else (v,)))
 
-        # Return the formatted argument string by combining the argument name, join character, and value.
-        return arg_name + join + str(val)
+    # Join all the generated argument strings into a single command-line string separated by spaces.
+    return " ".join(out)
+
+
+def dict2argv(args, double="--", single="-", join_double=" ", join_single=" "):
+    """
+    Convert a dictionary of options into an argument list, the counterpart of
+    `dict2args` for commands executed without a shell.
+
+    Args:
+    args (dict): Option names mapped to their values. List values repeat the
+        option, and empty or None values produce a bare flag.
+    double (str): Prefix for long option names.
+    single (str): Prefix for single-letter option names.
+    join_double (str): Separator between a long option and its value; a space
+        keeps them as separate arguments.
+    join_single (str): Separator between a short option and its value.
+
+    Returns:
+    list: The argument list.
+    """
 
     out = []
     for k, v in args.items():
-        if isinstance(v, list):
-            # If the value is a list, generate an argument string for each item in the list.
-            for item in v:
-                out.append(gen_arg(k, item))
+        if len(k) > 1:
+            arg_name, join = double + k, join_double
         else:
-            # If the value is not a list, generate a single argument string.
-            out.append(gen_arg(k, v))
+            arg_name, join = single + k, join_single
+        split = join == " "
+
+        for item in v if isinstance(v, list) else (v,):
+            if item is None or item == "":
+                out.append(arg_name)
+                continue
+            # There is no shell to expand ~ and $VAR anymore, so do it here
+            item = expand_path(str(item))
+            if split:
+                out += (arg_name, item)
+            else:
+                out.append(arg_name + join + item)
+    return out
+
+
+def _unescape_mount_field(field):
+    """
+    Decodes the octal escapes (e.g. '\\040' for a space) used in kernel mount tables.
 
-    # Join all the generated argument strings into a single command-line string separated by spaces.
-    return " ".join(out)
+    Args:
+        field (str): A field from /proc/self/mountinfo.
+
+    Returns:
+        str: The decoded field.
+    """
+    if "\\" not in field:
+        return field
+    return re.sub(r"\\([0-7]{3})", lambda m: chr(int(m.group(1), 8)), field)
+
+
+def read_mountinfo(path="/proc/self/mountinfo"):
+    """
+    Reads the Linux mount table directly from the kernel, without running 'mount'.
+
+    Each line looks like:
+    36 35 98:0 /mnt1 /mnt2 rw,noatime master:1 - ext3 /dev/root rw,errors=continue
+
+    Args:
+        path (str): The mountinfo file to read.
+
+    Returns:
+        list of dict: The mounts in the same format as `parse_mount`.
+    """
+    with open(path, "r") as f:
+        lines = f.read().splitlines()
+
+    mounts = []
+    for line in lines:
+        fields = line.split()
+        try:
+            sep = fields.index("-", 6)
+        except ValueError:
+            continue
+        options = fields[5]
+        if len(fields) > sep + 3:
+            options += "," + fields[sep + 3]
+        mounts.append(
+            {
+                "src": _unescape_mount_field(fields[sep + 2]),
+                "dst": _unescape_mount_field(fields[4]),
+                "fstype": fields[sep + 1],
+                "args": "(" + options + ")",
+            }
+        )
+    return mounts
 
 
 def parse_mount():
@@ -197,42 +511,128 @@ def parse_mount():
     Retrieves information about all the current mount points in the system by
     executing the 'mount' command. It then parses each line of the output to
     extract source, destination, filesystem type, and mount arguments into a
-    structured dictionary format.
+    structured dictionary format. On Linux the table is read from
+    /proc/self/mountinfo instead, which avoids spawning a process.
 
     Returns:
         list of dict: A list of dictionaries, where each dictionary contains
-                      the details of a mount point with keys 'src', 'dest',
+                      the details of a mount point with keys 'src', 'dst',
                       'fstype', and 'args'.
     """
-
-    output = execute_command("mount")
+    if _SYSTEM == "Linux":
+        try:
+            return read_mountinfo()
+        except OSError:
+            pass
+
+    # The line format is picked once instead of for every line
+    if _SYSTEM == "Linux":
+        pattern = _LINUX_MOUNT_RE
+    elif _SYSTEM == "Darwin":
+        pattern = _DARWIN_MOUNT_RE
+    else:
+        return []
+    is_darwin = _SYSTEM == "Darwin"
 
     mounts = []
-    for line in output.splitlines():
-        if platform.system() == "Linux":
-            # For Linux, mount output is typically like:
-            # /dev/sda1 on / type ext4 (rw,relatime,errors=remount-ro)
-            match = re.match(r"(.+?) on (.+?) type (.+?) \((.+)\)", line)
-            if match:
-                device, mount_point, fstype, options = match.groups()
-        elif platform.system() == "Darwin":
-            # For macOS, mount output is typically like:
-            # /dev/disk1s1 on / (apfs, local, read-only, journaled)
-            match = re.match(r"(.+?) on (.+?) \((.+?), (.+)\)", line)
-            if match:
-                device, mount_point, fstype, options = match.groups()
-                options = options.split(", ")
-        else:
+    for line in execute_command_lines(["mount"]):
+        match = pattern.match(line)
+        if not match:
             continue
-
-        if match:
-            mounts.append(
-                {
-                    "src": device,
-                    "dst": mount_point,
-                    "fstype": fstype,
-                    "args": "(" + " ".join(options) + ")",
-                }
-            )
+        device, mount_point, fstype, options = match.groups()
+        if is_darwin:
+            options = " ".join(options.split(", ")) if options else ""
+        mounts.append(
+            {
+                "src": device,
+                "dst": mount_point,
+                "fstype": fstype,
+                "args": "(" + options + ")",
+            }
+        )
 
     return mounts
+
+
+def tree_fingerprint(path):
+    """
+    Compute a fingerprint of a file or directory tree from the relative path,
+    size, modification/change times and mode of every entry. Symbolic links are
+    not followed and unreadable entries are skipped.
+
+    Args:
+        path (str): The file or directory to fingerprint.
+
+    Returns:
+        str: The hexadecimal digest of the tree.
+    """
+    root = expand_path(path)
+    digest = hashlib.blake2b(digest_size=16)
+
+    def add(name, st):
+        digest.update(name.encode("utf-8", "surrogateescape") + b"\0")
+        digest.update(
+            struct.pack("!QqqI", st.st_size, st.st_mtime_ns, st.st_ctime_ns, st.st_mode)
+        )
+
+    try:
+        add(".", os.stat(root, follow_symlinks=False))
+    except OSError:
+        return None
+
+    stack = [root]
+    while stack:
+        current = stack.pop()
+        try:
+            with os.scandir(current) as it:
+                entries = sorted(it, key=lambda entry: entry.name)
+        except OSError:
+            continue
+        for entry in entries:
+            try:
+                add(
+                    os.path.relpath(entry.path, root), entry.stat(follow_symlinks=False)
+                )
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(entry.path)
+            except OSError:
+                continue
+    return digest.hexdigest()
+
+
+def _fingerprint_file(key):
+    """Path of the cache file storing the fingerprint identified by `key`."""
+    cache_home = os.environ.get("XDG_CACHE_HOME") or os.path.expanduser("~/.cache")
+    name = hashlib.blake2b(key.encode("utf-8"), digest_size=16).hexdigest()
+    return os.path.join(cache_home, "bare", f"fp_{name}")
+
+
+def load_fingerprint(key):
+    """
+    Retrieve the fingerprint stored by the last successful run for `key`.
+
+    Args:
+        key (str): Identifier of the source/destination pair.
+
+    Returns:
+        str: The stored fingerprint, or None if there is none.
+    """
+    try:
+        with open(_fingerprint_file(key)) as f:
+            return f.read().strip()
+    except OSError:
+        return None
+
+
+def store_fingerprint(key, fingerprint):
+    """
+    Store the fingerprint of a successful run for `key`.
+
+    Args:
+        key (str): Identifier of the source/destination pair.
+        fingerprint (str): The fingerprint to store.
+    """
+    path = _fingerprint_file(key)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "w") as f:
+        f.write(fingerprint)
@@ -13,12 +13,15 @@ setup(
     install_requires=[
         "PyYAML>=5.4.1",
     ],
+    extras_require={
+        "fast": ["orjson"],
+    },
     classifiers=[
         "Programming Language :: Python :: 3",
         "License :: OSI Approved :: MIT License",
         "Operating System :: OS Independent",
     ],
-    python_requires=">=3.6",
+    python_requires=">=3.7",
     entry_points={
         "console_scripts": [
             "bare=bare.bare_main:main",  # Ensure 'bare_main.py' exists within 'bare' package and defines 'main()'